@@ -1,5 +1,7 @@
 # bank_monitoring/app_mcp/tools/bank_name_normalizer.py
 
+from functools import lru_cache
+
 from mcp.server.fastmcp import FastMCP
 
 BANK_NAME_MAP = {
@@ -36,6 +38,8 @@ BANK_NAME_MAP = {
 }
 
 
+# 입력 은행명 종류가 적으므로 결과를 캐시 (부분 매칭 루프 재실행 방지)
+@lru_cache(maxsize=512)
 def normalize_name(name: str):
     name = name.strip()
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 import json
+import sys
 
 # 기존 import 제거
 # from core.db import get_fss_for_bank, insert_risk_run
@@ -95,6 +96,12 @@ async def insert_risk_run(
 # JSON → BankExposure 변환 헬퍼
 # ─────────────────────────────────────────────
 
+_BUCKET_BY_VALUE_OR_NAME: Dict[str, MaturityBucket] = {
+    **{b.name: b for b in MaturityBucket},
+    **{b.value: b for b in MaturityBucket},
+}
+
+
 def _deserialize_exposure(x: Dict[str, Any]) -> BankExposure:
     """
     웹/MCP에서 넘어온 dict를 BankExposure로 변환.
@@ -106,21 +113,16 @@ def _deserialize_exposure(x: Dict[str, Any]) -> BankExposure:
     else:
         credit_rating = CreditRating.NR
 
+    # value("7D") 우선, 없으면 member 이름("D_7"), 둘 다 아니면 OVERNIGHT
     maturity_raw = x.get("maturity_bucket", "ON")
-
-    try:
-        maturity_bucket = MaturityBucket(maturity_raw)
-    except Exception:
-        try:
-            maturity_bucket = MaturityBucket[maturity_raw]
-        except Exception:
-            maturity_bucket = MaturityBucket.OVERNIGHT
+    maturity_bucket = _BUCKET_BY_VALUE_OR_NAME.get(maturity_raw, MaturityBucket.OVERNIGHT)
 
     return BankExposure(
-        bank_id=str(x.get("bank_id", "")),
+        # dict 키로 반복 사용되는 식별자는 intern
+        bank_id=sys.intern(str(x.get("bank_id", ""))),
         name=str(x.get("name", "")),
-        group_id=str(x.get("group_id", "")),
-        region=str(x.get("region", "KR")),
+        group_id=sys.intern(str(x.get("group_id", ""))),
+        region=sys.intern(str(x.get("region", "KR"))),
         exposure=float(x.get("exposure", 0.0)),
         credit_rating=credit_rating,
         lcr=x.get("lcr"),
@@ -187,7 +189,7 @@ async def get_bank_risk_score(
         "bank_id": result.bank_id,
         "name": result.name,
         "score": result.score,
-        "detail": result.detail
+        "detail": result.detail._asdict(),
     }
 
 
@@ -216,7 +218,9 @@ async def run_bank_stress_test(
         "run_off_amount": res.run_off_amount,
         "net_liquid_assets": res.net_liquid_assets,
         "coverage_ratio": res.coverage_ratio,
-        "detail_by_bank": res.detail_by_bank,
+        "detail_by_bank": {
+            bank_id: d._asdict() for bank_id, d in res.detail_by_bank.items()
+        },
     }
 
 
@@ -242,6 +246,7 @@ async def suggest_bank_rebalance(
                 detail={"override": score},
             )
     else:
+        inputs: List[BankRiskScoreInput] = []
         for e in ex_list:
 
             # 🔥 custody_agent(KSD)는 rebalance 대상 제외
@@ -249,12 +254,13 @@ async def suggest_bank_rebalance(
             if "예탁" in lname or "ksd" in lname:
                 continue
 
-            inp = BankRiskScoreInput(
+            inputs.append(BankRiskScoreInput(
                 exposure=e,
                 rwa_weight=RATING_RWA_WEIGHT.get(e.credit_rating, 1.0),
-            )
-            r = ENGINE.compute_bank_risk_score(inp)
-            score_map[e.bank_id] = r
+            ))
+
+        for r in ENGINE.compute_bank_risk_scores_batch(inputs):
+            score_map[r.bank_id] = r
 
     sug: RebalanceSuggestion = ENGINE.suggest_rebalance(ex_list, score_map)
 
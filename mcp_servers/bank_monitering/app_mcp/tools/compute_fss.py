@@ -1,7 +1,8 @@
 # app_mcp/tools/compute_fss.py
 
 from __future__ import annotations
-from typing import Any, Dict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
 import json
 from core.db.pool import get_pool
 
@@ -41,6 +42,40 @@ async def get_latest_fss(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+async def get_latest_fss_bulk(
+    bank_ids: List[str],
+    max_age: Optional[timedelta] = None,
+) -> Dict[str, float]:
+    """
+    여러 은행의 최신 FSS 를 쿼리 1회로 조회.
+    max_age 를 주면 그 기간 안에 저장된 스냅샷만 사용한다.
+    반환: {bank_id: fss_score} (스냅샷 없는 / 오래된 은행은 제외)
+    """
+    if not bank_ids:
+        return {}
+
+    pool = await get_pool()
+
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT DISTINCT ON (bank_id) bank_id, fss_score
+            FROM stablecoin.fss_snapshots
+            WHERE bank_id = ANY($1::text[])
+              AND ($2::interval IS NULL OR created_at >= NOW() - $2::interval)
+            ORDER BY bank_id, created_at DESC
+            """,
+            list(bank_ids),
+            max_age,
+        )
+
+    return {
+        r["bank_id"]: float(r["fss_score"])
+        for r in rows
+        if r["fss_score"] is not None
+    }
+
+
 # ─────────────────────────────────────────────
 # DB INSERT / UPSERT
 # ─────────────────────────────────────────────
@@ -11,9 +11,8 @@ import os
 import zipfile
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-
 from core.config.dart import get_dart_settings
+from core.utils import http
 from datetime import datetime
 
 DART_SETTINGS = get_dart_settings()
@@ -26,17 +25,11 @@ DART_BASE = "https://opendart.fss.or.kr/api"
 # ─────────────────────────────────────────────
 
 async def _get_json(url: str, params: dict, timeout: float = 30.0) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        return r.json()
+    return await http.get(url, params=params, timeout=timeout)
 
 
 async def _get_bytes(url: str, params: dict, timeout: float = 60.0) -> bytes:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        return r.content
+    return await http.get_bytes(url, params=params, timeout=timeout)
 
 
 def _to_number(v: Optional[str]) -> Optional[float]:
@@ -1,14 +1,24 @@
 # disclosures.py
 from __future__ import annotations
 
+import asyncio
+import heapq
 import io
+import json
+import logging
+import os
+import tempfile
+import time
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List
-
-import httpx
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.config.dart import get_dart_settings
+from core.utils import http
+
+logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────
 # DART 설정
@@ -57,16 +67,33 @@ BANK_NAME_MAP: Dict[str, str] = {
     "한국예탁결제원": "한국예탁결제원",
 }
 
+# 소문자 key → 공식명 (완전 일치 O(1) 조회용, import 시 1회 생성)
+_NORMALIZED_ALIAS_MAP: Dict[str, str] = {
+    key.lower(): official for key, official in BANK_NAME_MAP.items()
+}
+
+
+@lru_cache(maxsize=2048)
 def normalize_keyword(keyword: str) -> str:
     low = keyword.strip().lower()
 
-    for key, official in BANK_NAME_MAP.items():
-        if key.lower() == low or key.lower() in low:
-            print(f"🔄 정규화: '{keyword}' → '{official}'")
+    # 완전 일치 우선 (대부분의 입력)
+    official = _NORMALIZED_ALIAS_MAP.get(low)
+    if official is not None:
+        logger.debug("🔄 정규화: '%s' → '%s'", keyword, official)
+        if official == "한국예탁결제원":
+            logger.debug("⚠️ 한국예탁결제원(KSD) 재무제표 조회 제외됨")
+            return "KSD_EXCLUDED"
+        return official
+
+    # 부분 매칭 fallback
+    for key, official in _NORMALIZED_ALIAS_MAP.items():
+        if key in low:
+            logger.debug("🔄 정규화: '%s' → '%s'", keyword, official)
 
             # 🔥 예탁결제원이면 여기서 즉시 제외하도록 처리
             if official == "한국예탁결제원":
-                print("⚠️ 한국예탁결제원(KSD) 재무제표 조회 제외됨")
+                logger.debug("⚠️ 한국예탁결제원(KSD) 재무제표 조회 제외됨")
                 return "KSD_EXCLUDED"
 
             return official
@@ -79,20 +106,146 @@ def normalize_keyword(keyword: str) -> str:
 # ─────────────────────────────────────────────
 
 async def download_corp_code_zip() -> bytes:
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        r = await client.get(CORP_CODE_BASE_URL, params={"crtfc_key": DART_API_KEY})
-        r.raise_for_status()
-        return r.content
+    return await http.get_bytes(
+        CORP_CODE_BASE_URL, params={"crtfc_key": DART_API_KEY}, timeout=30.0
+    )
 
 
-async def load_corp_code_xml_root() -> ET.Element:
-    raw = await download_corp_code_zip()
+# ─────────────────────────────────────────────
+# corpCode 파싱 결과 캐시 (메모리 + 디스크 warm-start)
+# ─────────────────────────────────────────────
 
-    with zipfile.ZipFile(io.BytesIO(raw)) as zf:
-        xml_bytes = zf.read("CORPCODE.xml")
+CORP_CACHE_PATH = Path(
+    os.getenv(
+        "DART_CORP_CACHE_PATH",
+        str(Path.home() / ".cache" / "bank_monitoring" / "corpcode.json"),
+    )
+)
+CORP_CACHE_TTL_SEC = 24 * 60 * 60
+
+# {
+#   "saved_at": epoch sec,
+#   "records": [{corp_name, corp_code, stock_code, modify_date}, ...],
+#   "index": [(corp_name.lower(), record), ...],   # 검색 루프용 (lower 1회 계산)
+# }
+_CORP_CACHE: Dict[str, Any] = {}
+_CORP_CACHE_LOCK = asyncio.Lock()
+
+
+def _parse_corp_records(xml_bytes: bytes) -> List[Dict[str, str]]:
+    """CORPCODE.xml → record 리스트 (KSD 제외)"""
+    records: List[Dict[str, str]] = []
+
+    for _, el in ET.iterparse(io.BytesIO(xml_bytes)):
+        if el.tag != "list":
+            continue
 
-    root = ET.fromstring(xml_bytes)
-    return root
+        corp_code = (el.findtext("corp_code") or "").strip()
+
+        # 🔥 한국예탁결제원 제외
+        if corp_code not in KSD_CORP_CODES:
+            records.append({
+                "corp_name": (el.findtext("corp_name") or "").strip(),
+                "corp_code": corp_code,
+                "stock_code": (el.findtext("stock_code") or "").strip(),
+                "modify_date": (el.findtext("modify_date") or "").strip(),
+            })
+
+        el.clear()
+
+    return records
+
+
+def _build_corp_cache(
+    records: List[Dict[str, str]], saved_at: Optional[float] = None
+) -> Dict[str, Any]:
+    return {
+        "saved_at": time.time() if saved_at is None else saved_at,
+        "records": records,
+        "index": [(r["corp_name"].lower(), r) for r in records],
+    }
+
+
+def _is_fresh(cache: Dict[str, Any]) -> bool:
+    return time.time() - cache.get("saved_at", 0.0) < CORP_CACHE_TTL_SEC
+
+
+def _read_corp_cache_file() -> Optional[Dict[str, Any]]:
+    # 디스크에는 saved_at + records 만 JSON 으로 저장 (pickle 은 로드 시 임의 코드 실행 위험)
+    # index 는 로드 후 records 로 다시 만든다
+    try:
+        with CORP_CACHE_PATH.open("rb") as f:
+            data = json.load(f)
+        cache = _build_corp_cache(data["records"], float(data["saved_at"]))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("corpCode 캐시 파일 로드 실패 (%s): %s", CORP_CACHE_PATH, e)
+        return None
+
+    return cache if _is_fresh(cache) else None
+
+
+def _write_corp_cache_file(cache: Dict[str, Any]) -> None:
+    # 워커마다 고유한 임시 파일에 쓴 뒤 os.replace 로 교체 (동시 저장 시 서로 덮어쓰지 않음)
+    tmp_path: Optional[str] = None
+    try:
+        CORP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=CORP_CACHE_PATH.parent,
+            prefix=CORP_CACHE_PATH.name + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_path = f.name
+            json.dump(
+                {"saved_at": cache["saved_at"], "records": cache["records"]},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, CORP_CACHE_PATH)
+    except OSError as e:
+        logger.warning("corpCode 캐시 파일 저장 실패 (%s): %s", CORP_CACHE_PATH, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+async def _load_corp_cache() -> Dict[str, Any]:
+    """
+    파싱된 corpCode 캐시 반환.
+    메모리 → 디스크(24h 이내) → DART 다운로드 순으로 조회한다.
+    """
+    if _CORP_CACHE and _is_fresh(_CORP_CACHE):
+        return _CORP_CACHE
+
+    async with _CORP_CACHE_LOCK:
+        if _CORP_CACHE and _is_fresh(_CORP_CACHE):
+            return _CORP_CACHE
+
+        cache = _read_corp_cache_file()
+
+        if cache is None:
+            raw = await download_corp_code_zip()
+            with zipfile.ZipFile(io.BytesIO(raw)) as zf:
+                xml_bytes = zf.read("CORPCODE.xml")
+
+            cache = _build_corp_cache(_parse_corp_records(xml_bytes))
+            _write_corp_cache_file(cache)
+
+        _CORP_CACHE.clear()
+        _CORP_CACHE.update(cache)
+
+    return _CORP_CACHE
+
+
+async def load_corp_records() -> List[Dict[str, str]]:
+    return (await _load_corp_cache())["records"]
 
 
 # ─────────────────────────────────────────────
@@ -104,35 +257,19 @@ async def corp_codes_search(keyword: str) -> List[Dict[str, str]]:
     if not keyword:
         return []
 
-    print(f"🔍 DART 검색: '{keyword}'")
+    logger.debug("🔍 DART 검색: '%s'", keyword)
 
     # 🔥 KSD는 여기서 즉시 제외
     if keyword == "KSD_EXCLUDED":
-        print("⚠️ KSD는 corp_code 검색 제외됨")
+        logger.debug("⚠️ KSD는 corp_code 검색 제외됨")
         return []
 
-    root = await load_corp_code_xml_root()
-    out = []
-
+    index = (await _load_corp_cache())["index"]
     keyword_l = keyword.lower()
 
-    for el in root.iter("list"):
-        corp_name = (el.findtext("corp_name") or "").strip()
-        corp_code = (el.findtext("corp_code") or "").strip()
-
-        # 🔥 한국예탁결제원 제외
-        if corp_code in KSD_CORP_CODES:
-            continue
-
-        if keyword_l in corp_name.lower():
-            out.append({
-                "corp_name": corp_name,
-                "corp_code": corp_code,
-                "stock_code": (el.findtext("stock_code") or "").strip(),
-                "modify_date": (el.findtext("modify_date") or "").strip(),
-            })
+    out = [rec for name_lower, rec in index if keyword_l in name_lower]
 
-    print(f"📋 검색 결과: {len(out)}개 (KSD 제외됨)")
+    logger.debug("📋 검색 결과: %d개 (KSD 제외됨)", len(out))
     return out
 
 
@@ -140,6 +277,29 @@ async def corp_codes_search(keyword: str) -> List[Dict[str, str]]:
 # corp_code 선택
 # ─────────────────────────────────────────────
 
+def _candidate_sort_key(c: Dict[str, str], normalized: str) -> Tuple[int, str]:
+    """가중치 내림차순, 동점이면 회사명 오름차순"""
+    name = c.get("corp_name", "")
+    w = 0
+
+    if name == normalized:
+        w += 20
+    elif normalized in name:
+        w += 10
+
+    for kw in ["금융", "은행", "증권", "산업"]:
+        if kw in name:
+            w += 3
+
+    if c.get("stock_code"):
+        w += 5
+
+    if "지주" in name:
+        w -= 2
+
+    return (-w, name)
+
+
 async def resolve_corp_code(keyword: str, limit: int = 5) -> Dict[str, Any]:
     normalized = normalize_keyword(keyword)
 
@@ -157,32 +317,10 @@ async def resolve_corp_code(keyword: str, limit: int = 5) -> Dict[str, Any]:
     if not candidates:
         return {"best": None, "candidates": [], "normalized_keyword": normalized}
 
-    weighted = []
-
-    for c in candidates:
-        name = c.get("corp_name", "")
-        w = 0
-
-        if name == normalized:
-            w += 20
-        elif normalized in name:
-            w += 10
-
-        for kw in ["금융", "은행", "증권", "산업"]:
-            if kw in name:
-                w += 3
-
-        if c.get("stock_code"):
-            w += 5
-
-        if "지주" in name:
-            w -= 2
-
-        weighted.append((w, c))
-
-    weighted.sort(key=lambda x: (-x[0], x[1].get("corp_name", "")))
-
-    best_list = [w[1] for w in weighted[:limit]]
+    # 전체 정렬 대신 상위 limit개만 선택 (O(N log limit))
+    best_list = heapq.nsmallest(
+        limit, candidates, key=lambda c: _candidate_sort_key(c, normalized)
+    )
     best = best_list[0] if best_list else None
 
     return {
@@ -12,17 +12,33 @@ z = requests.get(
 with zipfile.ZipFile(io.BytesIO(z)) as zf:
     xml = zf.read("CORPCODE.xml")
 
-root = ET.fromstring(xml)
+# corp_name → record (파싱 시 1회 구축, 이후 O(1) 조회)
+_BY_NAME = {}
+_BY_NAME_LOWER = {}
+
+for _, el in ET.iterparse(io.BytesIO(xml)):
+    if el.tag != "list":
+        continue
+
+    corp_name = (el.findtext("corp_name") or "").strip()
+    record = {
+        "corp_name": el.findtext("corp_name"),
+        "corp_code": el.findtext("corp_code"),
+        "stock_code": el.findtext("stock_code"),
+        "modify_date": el.findtext("modify_date"),
+    }
+
+    # 동명 법인은 기존 선형 탐색과 동일하게 첫 항목 유지
+    _BY_NAME.setdefault(corp_name, record)
+    _BY_NAME_LOWER.setdefault(corp_name.lower(), record)
+
+    el.clear()
 
 def find_corp(name):
-    for el in root.iter("list"):
-        if (el.findtext("corp_name") or "").strip() == name:
-            return {
-                "corp_name": el.findtext("corp_name"),
-                "corp_code": el.findtext("corp_code"),
-                "stock_code": el.findtext("stock_code"),
-                "modify_date": el.findtext("modify_date"),
-            }
+    return _BY_NAME.get(name)
+
+def find_corp_ci(name):
+    return _BY_NAME_LOWER.get(name.strip().lower())
 
 print(find_corp("하나금융지주"))
 print(find_corp("NH투자증권"))
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 import logging
 from mcp.server.fastmcp import FastMCP
 
@@ -19,28 +20,33 @@ logger = logging.getLogger(__name__)
 # 만기 표준화
 # ──────────────────────────────────────
 
+_MATURITY_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "OVERNIGHT": ("ON", "O/N", "CALL", "OVERNIGHT"),
+    "WITHIN_7D": ("7D", "7_DAY", "WITHIN_7D"),
+    "WITHIN_1M": ("1M", "1_MONTH", "WITHIN_1M"),
+    "WITHIN_3M": ("3M", "3_MONTH", "WITHIN_3M"),
+}
+
+# alias → 표준 버킷 (1회 dict 조회)
+_MATURITY_ALIAS_MAP: Dict[str, str] = {
+    alias: canonical
+    for canonical, aliases in _MATURITY_ALIASES.items()
+    for alias in aliases
+}
+
+
 def _normalize_maturity_bucket(raw: Any) -> str:
     if raw is None:
         return "UNKNOWN"
 
-    bucket = str(raw).strip().upper()
-
-    if bucket in ("ON", "O/N", "CALL", "OVERNIGHT"):
-        return "OVERNIGHT"
-    if bucket in ("7D", "7_DAY", "WITHIN_7D"):
-        return "WITHIN_7D"
-    if bucket in ("1M", "1_MONTH", "WITHIN_1M"):
-        return "WITHIN_1M"
-    if bucket in ("3M", "3_MONTH", "WITHIN_3M"):
-        return "WITHIN_3M"
-
-    return "UNKNOWN"
+    return _MATURITY_ALIAS_MAP.get(str(raw).strip().upper(), "UNKNOWN")
 
 
 # ──────────────────────────────────────
 # 기관 타입 자동 감지 (🔥 버그 수정 버전)
 # ──────────────────────────────────────
 
+@lru_cache(maxsize=4096)
 def _detect_institution_type(bank_id: str | None, name: str | None) -> str:
     key = (bank_id or name or "").lower()
 
@@ -80,12 +86,13 @@ def _detect_institution_type(bank_id: str | None, name: str | None) -> str:
 # 자동 분해
 # ───────────────────────────────────────────────────────
 
-AUTO_MATURITY_DISTRIBUTION = {
-    "OVERNIGHT": 0.80,
-    "WITHIN_7D": 0.10,
-    "WITHIN_1M": 0.07,
-    "WITHIN_3M": 0.03,
-}
+# (bucket, ratio) 순서 고정 tuple — 매 호출 dict 순회 비용 제거
+AUTO_MATURITY_DISTRIBUTION: Tuple[Tuple[str, float], ...] = (
+    ("OVERNIGHT", 0.80),
+    ("WITHIN_7D", 0.10),
+    ("WITHIN_1M", 0.07),
+    ("WITHIN_3M", 0.03),
+)
 
 
 def _split_auto_maturity(
@@ -98,23 +105,31 @@ def _split_auto_maturity(
     credit_rating: str | None,
 ) -> List[BankExposureInput]:
 
-    out: List[BankExposureInput] = []
+    # 입력값 검증은 은행당 1회만 수행
+    base = BankExposureInput(
+        bank_id=bank_id,
+        name=name,
+        group_id=group_id,
+        is_policy_bank=is_policy,
+        exposure=balance,
+        credit_rating=credit_rating,
+        type=inst_type,
+    )
 
-    for bucket, ratio in AUTO_MATURITY_DISTRIBUTION.items():
-        out.append(
-            BankExposureInput(
-                bank_id=bank_id,
-                name=name,
-                group_id=group_id,
-                is_policy_bank=is_policy,
-                exposure=balance * ratio,
-                credit_rating=credit_rating,
-                maturity_bucket=bucket,
-                type=inst_type,
-            )
+    # 버킷별 분해 값은 내부에서 생성한 신뢰 값 → 검증 생략(model_construct)
+    return [
+        BankExposureInput.model_construct(
+            bank_id=base.bank_id,
+            name=base.name,
+            group_id=base.group_id,
+            is_policy_bank=base.is_policy_bank,
+            exposure=base.exposure * ratio,
+            credit_rating=base.credit_rating,
+            maturity_bucket=bucket,
+            type=base.type,
         )
-
-    return out
+        for bucket, ratio in AUTO_MATURITY_DISTRIBUTION
+    ]
 
 
 # ──────────────────────────────────────
@@ -1,13 +1,20 @@
 # app_mcp/tools/reserve_role_engine.py
 
 from __future__ import annotations
+import asyncio
+import logging
+import re
+from datetime import timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from fastapi import HTTPException
 
-from app_mcp.tools.compute_fss import compute_fss_for_bank
+from app_mcp.tools.compute_fss import compute_fss_for_bank, get_latest_fss_bulk
 from app_mcp.tools.fss_core import compute_fss
 
+logger = logging.getLogger(__name__)
+
 
 # ───────────────────────────────────
 # ROLE 정의 — custody_agent 로 통일
@@ -34,36 +41,30 @@ ROLE_TARGET_LIMIT = {
 
 # ───────────────────────────────────
 # ROLE 탐지 로직 — 정확도 개선 버전
+#  역할별 키워드를 import 시 정규식 1개로 컴파일, 우선순위 순서대로 검사
 # ───────────────────────────────────
 
-def detect_role(name: str) -> str:
-    n = name.lower()
-
+_ROLE_PATTERNS = (
     # KSD
-    if "예탁" in n or "ksd" in n or "예탁결제" in n:
-        return "custody_agent"
-
+    ("custody_agent", re.compile(r"예탁|ksd")),
     # 정책은행
-    if "산업은행" in n or "kdb" in n:
-        return "policy_bank"
-    if "기업은행" in n or "ibk" in n:
-        return "policy_bank"
-
+    ("policy_bank", re.compile(r"산업은행|kdb|기업은행|ibk")),
     # 시중은행 (정확 매칭)
-    if n.startswith("신한") or "shinhan" in n:
-        return "commercial_bank"
-    if n.startswith("국민") or n.startswith("kb") or "kbstar" in n:
-        return "commercial_bank"
-    if n.startswith("우리") or "woori" in n:
-        return "commercial_bank"
-
+    ("commercial_bank", re.compile(r"^(?:신한|국민|kb|우리)|shinhan|kbstar|woori")),
     # 커스터디(백업 은행)
-    if n.startswith("하나") or "hana" in n:
-        return "secondary_custodian"
-
+    ("secondary_custodian", re.compile(r"^하나|hana")),
     # 증권사
-    if "투자증권" in n or "증권" in n or "nh투자" in n or "futureasset" in n:
-        return "broker"
+    ("broker", re.compile(r"증권|nh투자|futureasset")),
+)
+
+
+@lru_cache(maxsize=2048)
+def detect_role(name: str) -> str:
+    n = name.lower()
+
+    for role, pattern in _ROLE_PATTERNS:
+        if pattern.search(n):
+            return role
 
     return "other"
 
@@ -80,6 +81,10 @@ class Institution(BaseModel):
     fss: Optional[float] = None
 
 
+# 기관 목록 일괄 검증 (행마다 Institution(**i) 호출 대신 pydantic-core 1회 호출)
+INSTITUTION_LIST_ADAPTER = TypeAdapter(List[Institution])
+
+
 class TargetAllocation(BaseModel):
     bank_id: str
     name: str
@@ -126,47 +131,43 @@ def compute_target_allocation(
     institutions: List[Institution],
     total_reserve: float,
 ):
-    alloc_pool = []
-    custody_pool = []
-
-    # 1) custody_agent 분리
+    alloc_pool: List[Institution] = []
+    custody_pool: List[Institution] = []
+    fss_list: List[float] = []
+    base_weights: List[float] = []
+    total_base = 0.0
+
+    # 1) custody_agent 분리 + base_weight 계산을 1회 순회로
+    #    (fss, base_weight 는 alloc_pool 과 병렬 리스트로 보관)
     for inst in institutions:
-        role = inst.role
-
-        if role == "custody_agent":
+        if inst.role == "custody_agent":
             custody_pool.append(inst)
             continue
 
-        fss = inst.fss if inst.fss is not None else 70
-        role_weight = ROLE_WEIGHTS[role]
-
-        base_weight = (fss / 100) / role_weight
+        fss = float(inst.fss) if inst.fss is not None else 70.0
+        base_weight = (fss / 100) / ROLE_WEIGHTS[inst.role]
 
-        alloc_pool.append({
-            "bank_id": inst.bank_id,
-            "name": inst.name,
-            "role": role,
-            "fss": fss,
-            "base_weight": base_weight,
-            "exposure": inst.exposure,
-        })
+        alloc_pool.append(inst)
+        fss_list.append(fss)
+        base_weights.append(base_weight)
+        total_base += base_weight
 
-    total_base = sum(a["base_weight"] for a in alloc_pool)
     if total_base <= 0:
         raise HTTPException(500, "base_weight 계산 실패")
 
-    # 2) 비중 배분
+    # 2) 비중 배분 (cap 적용) — 내부 계산값이므로 검증 생략
     results = []
-    for a in alloc_pool:
-        pct = a["base_weight"] / total_base
-
-        # cap 적용
-        cap = ROLE_TARGET_LIMIT[a["role"]]
-        pct = min(pct, cap)
-
-        a["target_pct"] = pct
-        a["target_amount"] = pct * total_reserve
-        results.append(TargetAllocation(**a))
+    for inst, fss, base_weight in zip(alloc_pool, fss_list, base_weights):
+        pct = min(base_weight / total_base, ROLE_TARGET_LIMIT[inst.role])
+
+        results.append(TargetAllocation.model_construct(
+            bank_id=inst.bank_id,
+            name=inst.name,
+            role=inst.role,
+            fss=fss,
+            target_pct=pct,
+            target_amount=pct * total_reserve,
+        ))
 
     return {
         "banks": results,
@@ -230,6 +231,60 @@ def compute_rebalance_plan(institutions, target_alloc):
 
 
 
+# ───────────────────────────────────
+# 공통 전처리 — role 탐지 + FSS 주입
+# ───────────────────────────────────
+
+FSS_CONCURRENCY = 16
+
+# 이보다 오래된 FSS 스냅샷은 사용하지 않고 기관별로 다시 계산
+FSS_SNAPSHOT_MAX_AGE = timedelta(days=1)
+
+async def _prepare_institutions(payload: Dict) -> List[Institution]:
+    insts = INSTITUTION_LIST_ADAPTER.validate_python(payload["institutions"])
+
+    # role 탐지는 동기 처리, 실제 FSS 조회가 필요한 기관만 따로 모은다
+    # (custody_agent / 정책은행 / fss 입력 기관은 I/O 없이 바로 결정)
+    lookups: List[Institution] = []
+    for i in insts:
+        i.role = detect_role(i.name)
+        if i.fss is None and i.role not in ("custody_agent", "policy_bank"):
+            lookups.append(i)
+        else:
+            await auto_fill_fss(i)
+
+    if not lookups:
+        return insts
+
+    # 저장된 최신 FSS 스냅샷을 쿼리 1회로 일괄 조회 (기관별 N 회 조회 대신)
+    try:
+        latest = await get_latest_fss_bulk(
+            [i.bank_id for i in lookups], max_age=FSS_SNAPSHOT_MAX_AGE
+        )
+    except Exception:
+        logger.exception("⚠ FSS 스냅샷 일괄 조회 실패 — 기관별 계산으로 진행")
+        latest = {}
+
+    if latest:
+        for i in lookups:
+            i.fss = latest.get(i.bank_id)
+        lookups = [i for i in lookups if i.fss is None]
+
+        if not lookups:
+            return insts
+
+    # 스냅샷 없는 기관만 개별 계산 → 동시 실행 (상한 FSS_CONCURRENCY)
+    sem = asyncio.Semaphore(FSS_CONCURRENCY)
+
+    async def _fill(inst: Institution):
+        async with sem:
+            return await auto_fill_fss(inst)
+
+    await asyncio.gather(*(_fill(i) for i in lookups))
+
+    return insts
+
+
 # ───────────────────────────────────
 # MCP 등록
 # ───────────────────────────────────
@@ -238,11 +293,7 @@ def register(mcp):
 
     @mcp.tool(name="role_based_allocation")
     async def _alloc(payload: Dict):
-        insts = [Institution(**i) for i in payload["institutions"]]
-
-        for i in insts:
-            i.role = detect_role(i.name)
-            await auto_fill_fss(i)
+        insts = await _prepare_institutions(payload)
 
         total = sum(i.exposure for i in insts)
         result = compute_target_allocation(insts, total)
@@ -251,11 +302,7 @@ def register(mcp):
 
     @mcp.tool(name="role_based_rebalance")
     async def _rebalance(payload: Dict):
-        insts = [Institution(**i) for i in payload["institutions"]]
-
-        for i in insts:
-            i.role = detect_role(i.name)
-            await auto_fill_fss(i)
+        insts = await _prepare_institutions(payload)
 
         total = sum(i.exposure for i in insts)
         alloc = compute_target_allocation(insts, total)
@@ -264,4 +311,4 @@ def register(mcp):
         return {
             "allocation": alloc,
             "rebalance_plan": plan
-        }
\ No newline at end of file
+        }
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 
 # ─────────────────────────────────────────────
@@ -40,7 +44,7 @@ class MaturityBucket(str, Enum):
     LONGER = "LT"
 
 
-@dataclass
+@dataclass(slots=True)
 class BankExposure:
     bank_id: str
     name: str
@@ -62,30 +66,39 @@ class BankExposure:
 # JSON → BankExposure 변환 함수 (MCP 핵심 버그 FIX)
 # ─────────────────────────────────────────────
 
+# 원시 문자열 → Enum (예외 기반 변환 대신 dict 조회)
+_RATING_BY_NAME: Dict[str, CreditRating] = {r.name: r for r in CreditRating}
+_BUCKET_BY_VALUE: Dict[str, MaturityBucket] = {b.value: b for b in MaturityBucket}
+
+
+def _intern_str(value):
+    """str 이면 intern, 그 외(int / None 등)는 입력 그대로 통과."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def _deserialize_exposures(items: List[Dict]) -> List[BankExposure]:
     out = []
     for x in items:
 
         # credit rating 변환
-        raw_credit = x.get("credit_rating", "NR")
-        try:
-            credit_rating = CreditRating[raw_credit]
-        except Exception:
-            credit_rating = CreditRating.NR
+        credit_rating = _RATING_BY_NAME.get(x.get("credit_rating", "NR"), CreditRating.NR)
 
         # maturity bucket 변환 ("ON" → MaturityBucket.OVERNIGHT)
-        raw_bucket = x.get("maturity_bucket", "ON")
-        try:
-            maturity_bucket = MaturityBucket(raw_bucket)
-        except Exception:
-            maturity_bucket = MaturityBucket.OVERNIGHT
+        maturity_bucket = _BUCKET_BY_VALUE.get(
+            x.get("maturity_bucket", "ON"), MaturityBucket.OVERNIGHT
+        )
+
+        # bank_id/group_id/region 은 이후 정책·스트레스 계산에서 dict 키로
+        # 반복 사용되므로 intern 해서 동일 객체(identity 비교)로 맞춘다
+        # (str 이 아닌 값은 기존처럼 그대로 전달)
+        bank_id = _intern_str(x["bank_id"])
 
         out.append(
             BankExposure(
-                bank_id=x["bank_id"],
+                bank_id=bank_id,
                 name=x["name"],
-                group_id=x.get("group_id", x["bank_id"]),
-                region=x.get("region", "KR"),
+                group_id=_intern_str(x.get("group_id", bank_id)),
+                region=_intern_str(x.get("region", "KR")),
                 exposure=float(x.get("exposure", 0)),
                 credit_rating=credit_rating,
                 maturity_bucket=maturity_bucket,
@@ -103,7 +116,7 @@ class PolicyConfig:
     max_exposure_per_institution: float = 0.25
     max_exposure_per_group: float = 0.40
 
-    rating_limit_multiplier: Dict[CreditRating, float] = field(
+    rating_limit_multiplier: Mapping[CreditRating, float] = field(
         default_factory=lambda: {
             CreditRating.AAA: 1.2,
             CreditRating.AA: 1.1,
@@ -116,7 +129,7 @@ class PolicyConfig:
         }
     )
 
-    maturity_target_weights: Dict[MaturityBucket, float] = field(
+    maturity_target_weights: Mapping[MaturityBucket, float] = field(
         default_factory=lambda: {
             MaturityBucket.OVERNIGHT: 0.30,
             MaturityBucket.D_7: 0.30,
@@ -126,6 +139,31 @@ class PolicyConfig:
         }
     )
 
+    # Enum 해시는 Python 레벨 __hash__ 를 타므로, 조회용 테이블은 value(str) 키로 보관.
+    # 위 두 매핑은 읽기 전용(MappingProxyType)으로 감싸고, 새 dict 를 대입하면
+    # __setattr__ 에서 조회 테이블도 함께 다시 만든다 (테이블이 어긋날 수 없음).
+    _rating_mult_by_value: Dict[str, float] = field(init=False, repr=False, compare=False)
+    _maturity_target_by_value: Dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "rating_limit_multiplier":
+            value = MappingProxyType(dict(value))
+            object.__setattr__(
+                self, "_rating_mult_by_value", {r.value: m for r, m in value.items()}
+            )
+        elif name == "maturity_target_weights":
+            value = MappingProxyType(dict(value))
+            object.__setattr__(
+                self, "_maturity_target_by_value", {b.value: w for b, w in value.items()}
+            )
+        object.__setattr__(self, name, value)
+
+    def mult_for(self, rating: CreditRating) -> float:
+        return self._rating_mult_by_value.get(rating.value, 1.0)
+
+    def maturity_target_for(self, bucket: MaturityBucket) -> Optional[float]:
+        return self._maturity_target_by_value.get(bucket.value)
+
 
 @dataclass
 class BankRiskScoreInput:
@@ -138,21 +176,43 @@ class BankRiskScoreInput:
     news_sentiment: Optional[float] = None
 
 
+class ScoreDetail(NamedTuple):
+    """Bank Risk Score 항목별 점수 (dict 대비 메모리/접근 비용 절감)."""
+    rating: float
+    lcr: float
+    insured: float
+    spread: float
+    news: float
+
+
 @dataclass
 class BankRiskScoreResult:
     bank_id: str
     name: str
     score: float
-    detail: Dict[str, float]
+    # 엔진 계산 결과는 ScoreDetail, 외부 점수 override 시에는 dict
+    detail: Union[ScoreDetail, Dict[str, float]]
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyBreach:
     type: str
     identifier: str
     current: float
     limit: float
-    description: str
+    name: str = ""  # institution 위반 시 은행명
+
+    # 설명 문자열은 필요할 때만 포맷 (위반 건수만 세는 호출자는 비용 없음)
+    @property
+    def description(self) -> str:
+        if self.type == "institution":
+            return f"{self.name} 기관 한도 초과 (현재 {self.current:.2%}, 한도 {self.limit:.2%})"
+        if self.type == "group":
+            return f"금융그룹({self.identifier}) 한도 초과 (현재 {self.current:.2%}, 한도 {self.limit:.2%})"
+        return f"만기 버킷 {self.identifier} 비중 편차 큼 (현재 {self.current:.2%}, 목표 {self.limit:.2%})"
+
+    def __str__(self) -> str:
+        return self.description
 
 
 @dataclass
@@ -162,6 +222,9 @@ class PolicyCheckResult:
     institution_shares: Dict[str, float]
     group_shares: Dict[str, float]
     maturity_shares: Dict[MaturityBucket, float]
+    total_exposure: float = 0.0
+    # bank_id → 등급 가중 기관 한도
+    institution_limits: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -171,6 +234,12 @@ class StressScenarioConfig:
     interest_rate_shock_bps: float = 0.0
 
 
+class StressDetail(NamedTuple):
+    """스트레스 결과의 은행별 상세."""
+    exposure: float
+    shock_unavailable: float
+
+
 @dataclass
 class StressResult:
     total_exposure: float
@@ -178,15 +247,28 @@ class StressResult:
     run_off_amount: float
     net_liquid_assets: float
     coverage_ratio: float
-    detail_by_bank: Dict[str, Dict[str, float]]
+    detail_by_bank: Dict[str, StressDetail]
 
 
-@dataclass
+@dataclass(slots=True)
 class RebalanceAction:
     from_bank_id: str
     to_bank_id: str
     amount: float
-    reason: str
+    from_name: str
+    to_name: str
+    from_share: float
+    from_limit: float
+
+    @property
+    def reason(self) -> str:
+        return (
+            f"{self.from_name} 비중 {self.from_share:.2%} → 한도 {self.from_limit:.2%} 이하로 낮추기 위해, "
+            f"리스크 점수 더 높은 {self.to_name}로 이동 제안"
+        )
+
+    def __str__(self) -> str:
+        return self.reason
 
 
 @dataclass
@@ -203,6 +285,38 @@ class RebalanceSuggestion:
 
 
 
+# ─────────────────────────────────────────────
+# Bank Risk Score 구간 테이블 (import 시 1회 생성)
+# ─────────────────────────────────────────────
+
+# CreditRating.value → 베이스 점수
+_RATING_SCORE: Dict[str, float] = {
+    CreditRating.AAA.value: 95,
+    CreditRating.AA.value: 90,
+    CreditRating.A.value: 85,
+    CreditRating.BBB.value: 75,
+    CreditRating.BB.value: 60,
+    CreditRating.B.value: 45,
+    CreditRating.CCC.value: 30,
+    CreditRating.NR.value: 70,
+}
+
+# LCR(%) — 80 / 100 / 120 이상 구간 (bisect_right: 경계값은 상위 구간)
+_LCR_BREAKS: Tuple[float, ...] = (80, 100, 120)
+_LCR_SCORES: Tuple[float, ...] = (50, 70, 85, 95)
+
+# 예금보험 커버 비율 — 0.5 / 0.7 / 0.9 이상 구간
+_INSURED_BREAKS: Tuple[float, ...] = (0.5, 0.7, 0.9)
+_INSURED_SCORES: Tuple[float, ...] = (55, 70, 85, 95)
+
+# 스프레드(bps) — 50 / 100 / 200 이하 구간 (bisect_left: 경계값은 하위 구간)
+_SPREAD_BREAKS: Tuple[float, ...] = (50, 100, 200)
+_SPREAD_SCORES: Tuple[float, ...] = (90, 80, 65, 50)
+
+# (rating, lcr, insured, spread, news) 가중치
+_SCORE_WEIGHTS: Tuple[float, ...] = (0.35, 0.20, 0.15, 0.20, 0.10)
+
+
 # ─────────────────────────────────────────────
 # 2. 핵심 엔진
 # ─────────────────────────────────────────────
@@ -219,19 +333,28 @@ class BankRiskEngine:
 
     @staticmethod
     def _compute_shares(exposures: List[BankExposure]) -> Tuple[Dict[str, float], Dict[str, float], Dict[MaturityBucket, float], float]:
-        total = sum(e.exposure for e in exposures)
+        # 1회 순회로 총액 + 기관/그룹/만기별 금액을 함께 합산하고,
+        # 비중 변환(나눗셈)은 그룹별 합계에 대해서만 마지막에 수행
+        total = 0.0
+        # 만기 자동 분할로 같은 bank_id 가 여러 행에 나올 수 있으므로 누적은 유지,
+        # defaultdict 로 get+set 두 번의 해시 조회를 1회로 줄인다
+        inst_amounts: Dict[str, float] = defaultdict(float)
+        group_amounts: Dict[str, float] = defaultdict(float)
+        mat_amounts: Dict[MaturityBucket, float] = {b: 0.0 for b in MaturityBucket}
+
+        for e in exposures:
+            amount = e.exposure
+            total += amount
+            inst_amounts[e.bank_id] += amount
+            group_amounts[e.group_id] += amount
+            mat_amounts[e.maturity_bucket] += amount
+
         if total <= 0:
             return {}, {}, {}, 0.0
 
-        inst_shares: Dict[str, float] = {}
-        group_shares: Dict[str, float] = {}
-        mat_shares: Dict[MaturityBucket, float] = {b: 0.0 for b in MaturityBucket}
-
-        for e in exposures:
-            share = e.exposure / total
-            inst_shares[e.bank_id] = inst_shares.get(e.bank_id, 0.0) + share
-            group_shares[e.group_id] = group_shares.get(e.group_id, 0.0) + share
-            mat_shares[e.maturity_bucket] = mat_shares.get(e.maturity_bucket, 0.0) + share
+        inst_shares = {k: v / total for k, v in inst_amounts.items()}
+        group_shares = {k: v / total for k, v in group_amounts.items()}
+        mat_shares = {k: v / total for k, v in mat_amounts.items()}
 
         return inst_shares, group_shares, mat_shares, total
 
@@ -241,7 +364,8 @@ class BankRiskEngine:
         전통 HHI: sum( (시장점유율 * 100)^2 ).
         0~10,000, 1,800 이상이면 고집중(규제 관점).
         """
-        return sum((s * 100) ** 2 for s in shares.values())
+        # sum((s*100)^2) == 10,000 * sum(s*s) — 항목당 곱셈 1회
+        return 10_000.0 * sum(s * s for s in shares.values())
 
     # ── 2-2. Policy 체크 ──
 
@@ -249,14 +373,19 @@ class BankRiskEngine:
         inst_shares, group_shares, mat_shares, total = self._compute_shares(exposures)
         breaches: List[PolicyBreach] = []
 
-        # 기관 단위 한도 체크 (등급 가중 한도 반영)
+        # 은행별 등급 가중 한도를 루프 전에 1회 계산
+        # (suggest_rebalance 도 PolicyCheckResult 를 통해 재사용)
         bank_map = {e.bank_id: e for e in exposures}
-        for bank_id, share in inst_shares.items():
-            bank = bank_map[bank_id]
-            base_limit = self.policy.max_exposure_per_institution
-            mult = self.policy.rating_limit_multiplier.get(bank.credit_rating, 1.0)
-            limit = base_limit * mult
+        base_limit = self.policy.max_exposure_per_institution
+        mult_for = self.policy.mult_for
+        limit_by_bank = {
+            bank_id: base_limit * mult_for(e.credit_rating)
+            for bank_id, e in bank_map.items()
+        }
 
+        # 기관 단위 한도 체크 (등급 가중 한도 반영) — 위반 건만 PolicyBreach 생성
+        for bank_id, share in inst_shares.items():
+            limit = limit_by_bank[bank_id]
             if share > limit:
                 breaches.append(
                     PolicyBreach(
@@ -264,13 +393,13 @@ class BankRiskEngine:
                         identifier=bank_id,
                         current=share,
                         limit=limit,
-                        description=f"{bank.name} 기관 한도 초과 (현재 {share:.2%}, 한도 {limit:.2%})",
+                        name=bank_map[bank_id].name,
                     )
                 )
 
         # 동일 그룹 합산 한도 체크
+        limit = self.policy.max_exposure_per_group
         for group_id, share in group_shares.items():
-            limit = self.policy.max_exposure_per_group
             if share > limit:
                 breaches.append(
                     PolicyBreach(
@@ -278,13 +407,13 @@ class BankRiskEngine:
                         identifier=group_id,
                         current=share,
                         limit=limit,
-                        description=f"금융그룹({group_id}) 한도 초과 (현재 {share:.2%}, 한도 {limit:.2%})",
                     )
                 )
 
         # 만기 버킷 목표 비중 체크
+        maturity_target_for = self.policy.maturity_target_for
         for bucket, share in mat_shares.items():
-            target = self.policy.maturity_target_weights.get(bucket)
+            target = maturity_target_for(bucket)
             if target is None:
                 continue
             # 단순히 편차가 큰 경우 breach로 처리 (예: ±10%p 이상)
@@ -295,7 +424,6 @@ class BankRiskEngine:
                         identifier=bucket.value,
                         current=share,
                         limit=target,
-                        description=f"만기 버킷 {bucket.value} 비중 편차 큼 (현재 {share:.2%}, 목표 {target:.2%})",
                     )
                 )
 
@@ -307,6 +435,8 @@ class BankRiskEngine:
             institution_shares=inst_shares,
             group_shares=group_shares,
             maturity_shares=mat_shares,
+            total_exposure=total,
+            institution_limits=limit_by_bank,
         )
 
     # ── 2-3. Bank Risk Score (0–100) ──
@@ -316,98 +446,68 @@ class BankRiskEngine:
         간단한 가중 평균 기반 Bank Risk Score.
         0점(매우 위험) ~ 100점(매우 안전).
         """
+        return self.compute_bank_risk_scores_batch([inp])[0]
 
-        # 1) 등급 기반 베이스 점수
-        rating_score_map: Dict[CreditRating, float] = {
-            CreditRating.AAA: 95,
-            CreditRating.AA: 90,
-            CreditRating.A: 85,
-            CreditRating.BBB: 75,
-            CreditRating.BB: 60,
-            CreditRating.B: 45,
-            CreditRating.CCC: 30,
-            CreditRating.NR: 70,
-        }
-        score_rating = rating_score_map.get(inp.exposure.credit_rating, 60)
-
-        # 2) LCR (100% 이상이면 가점, 80% 이하면 감점)
-        if inp.lcr_pct is not None:
-            if inp.lcr_pct >= 120:
-                score_lcr = 95
-            elif inp.lcr_pct >= 100:
-                score_lcr = 85
-            elif inp.lcr_pct >= 80:
-                score_lcr = 70
+    @staticmethod
+    def compute_bank_risk_scores_batch(
+        inputs: List[BankRiskScoreInput],
+    ) -> List[BankRiskScoreResult]:
+        """
+        여러 은행의 Bank Risk Score 일괄 계산.
+        구간 점수는 모듈 상수 테이블 + bisect 로 조회한다.
+        """
+        rating_scores = _RATING_SCORE
+        w_rating, w_lcr, w_insured, w_spread, w_news = _SCORE_WEIGHTS
+
+        results: List[BankRiskScoreResult] = []
+
+        for inp in inputs:
+            # 1) 등급 기반 베이스 점수
+            score_rating = rating_scores.get(inp.exposure.credit_rating.value, 60)
+
+            # 2) LCR (100% 이상이면 가점, 80% 이하면 감점)
+            if inp.lcr_pct is not None:
+                score_lcr = _LCR_SCORES[bisect_right(_LCR_BREAKS, inp.lcr_pct)]
             else:
-                score_lcr = 50
-        else:
-            score_lcr = 70  # 정보 없음: 중간값
-
-        # 3) 예금보험 커버 비율
-        if inp.insured_ratio is not None:
-            if inp.insured_ratio >= 0.9:
-                score_insured = 95
-            elif inp.insured_ratio >= 0.7:
-                score_insured = 85
-            elif inp.insured_ratio >= 0.5:
-                score_insured = 70
+                score_lcr = 70  # 정보 없음: 중간값
+
+            # 3) 예금보험 커버 비율
+            if inp.insured_ratio is not None:
+                score_insured = _INSURED_SCORES[bisect_right(_INSURED_BREAKS, inp.insured_ratio)]
             else:
-                score_insured = 55
-        else:
-            score_insured = 75
-
-        # 4) 시장 신용위험 (CDS/채권 스프레드, 낮을수록 좋음)
-        spread = None
-        if inp.cds_spread_bps is not None:
-            spread = inp.cds_spread_bps
-        elif inp.bond_spread_bps is not None:
-            spread = inp.bond_spread_bps
-
-        if spread is not None:
-            if spread <= 50:
-                score_spread = 90
-            elif spread <= 100:
-                score_spread = 80
-            elif spread <= 200:
-                score_spread = 65
+                score_insured = 75
+
+            # 4) 시장 신용위험 (CDS 우선, 없으면 채권 스프레드 — 낮을수록 좋음)
+            spread = inp.cds_spread_bps if inp.cds_spread_bps is not None else inp.bond_spread_bps
+            if spread is not None:
+                score_spread = _SPREAD_SCORES[bisect_left(_SPREAD_BREAKS, spread)]
             else:
-                score_spread = 50
-        else:
-            score_spread = 70
-
-        # 5) 뉴스 감성 (-1 ~ +1 → 40~90)
-        sentiment = inp.news_sentiment if inp.news_sentiment is not None else 0.0
-        score_news = 65 + sentiment * 25  # sentiment=-1 → 40, 0 → 65, +1 → 90
-
-        # 가중 평균 (가중치는 필요에 따라 조정)
-        w_rating = 0.35
-        w_lcr = 0.20
-        w_insured = 0.15
-        w_spread = 0.20
-        w_news = 0.10
-
-        score = (
-            score_rating * w_rating
-            + score_lcr * w_lcr
-            + score_insured * w_insured
-            + score_spread * w_spread
-            + score_news * w_news
-        )
+                score_spread = 70
+
+            # 5) 뉴스 감성 (-1 ~ +1 → 40~90)
+            sentiment = inp.news_sentiment if inp.news_sentiment is not None else 0.0
+            score_news = 65 + sentiment * 25  # sentiment=-1 → 40, 0 → 65, +1 → 90
+
+            score = (
+                score_rating * w_rating
+                + score_lcr * w_lcr
+                + score_insured * w_insured
+                + score_spread * w_spread
+                + score_news * w_news
+            )
 
-        detail = {
-            "rating": score_rating,
-            "lcr": score_lcr,
-            "insured": score_insured,
-            "spread": score_spread,
-            "news": score_news,
-        }
+            results.append(
+                BankRiskScoreResult(
+                    bank_id=inp.exposure.bank_id,
+                    name=inp.exposure.name,
+                    score=score,
+                    detail=ScoreDetail(
+                        score_rating, score_lcr, score_insured, score_spread, score_news
+                    ),
+                )
+            )
 
-        return BankRiskScoreResult(
-            bank_id=inp.exposure.bank_id,
-            name=inp.exposure.name,
-            score=score,
-            detail=detail,
-        )
+        return results
 
     # ── 2-4. 스트레스 시나리오 ──
 
@@ -427,27 +527,41 @@ class BankRiskEngine:
             # 요구불 + 7D 이내는 유동성 자산으로 간주
             liquid_buckets = [MaturityBucket.OVERNIGHT, MaturityBucket.D_7]
 
-        total = sum(e.exposure for e in exposures)
+        # 멤버십 검사는 value(str) 집합으로 (Enum __hash__/__eq__ 호출 회피)
+        liquid_values = frozenset(b.value for b in liquid_buckets)
+        shock_map = scenario.bank_liquidity_shock
 
+        # 총액/미가용액/유동자산을 1회 순회로 함께 계산
+        total = 0.0
         unavailable_amount = 0.0
-        run_off_amount = total * scenario.daily_runoff_rate
-
-        detail_by_bank: Dict[str, Dict[str, float]] = {}
         liquid_assets = 0.0
+        detail_by_bank: Dict[str, StressDetail] = {}
 
-        for e in exposures:
-            shock = scenario.bank_liquidity_shock.get(e.bank_id, 0.0)
-            bank_unavail = e.exposure * shock
-            unavailable_amount += bank_unavail
+        if not shock_map:
+            # 은행별 충격이 없는 기본 시나리오: 미가용액은 항상 0 → 조회/차감 생략
+            for e in exposures:
+                amount = e.exposure
+                total += amount
+
+                if e.maturity_bucket.value in liquid_values:
+                    liquid_assets += max(amount, 0.0)
+
+                detail_by_bank[e.bank_id] = StressDetail(amount, 0.0)
+        else:
+            for e in exposures:
+                amount = e.exposure
+                total += amount
+
+                bank_unavail = amount * shock_map.get(e.bank_id, 0.0)
+                unavailable_amount += bank_unavail
 
-            if e.maturity_bucket in liquid_buckets:
-                # 유동성 사다리 상단 계층
-                liquid_assets += max(e.exposure - bank_unavail, 0.0)
+                if e.maturity_bucket.value in liquid_values:
+                    # 유동성 사다리 상단 계층
+                    liquid_assets += max(amount - bank_unavail, 0.0)
 
-            detail_by_bank[e.bank_id] = {
-                "exposure": e.exposure,
-                "shock_unavailable": bank_unavail,
-            }
+                detail_by_bank[e.bank_id] = StressDetail(amount, bank_unavail)
+
+        run_off_amount = total * scenario.daily_runoff_rate
 
         net_liquid_assets = max(liquid_assets - run_off_amount, 0.0)
         denom = unavailable_amount + run_off_amount
@@ -476,7 +590,7 @@ class BankRiskEngine:
         """
         policy_result = self.check_policy(exposures)
         inst_shares = policy_result.institution_shares
-        total = sum(e.exposure for e in exposures) or 1.0
+        total = policy_result.total_exposure or 1.0
 
         bank_map = {e.bank_id: e for e in exposures}
         breaches_by_bank = {
@@ -492,71 +606,62 @@ class BankRiskEngine:
             reverse=True,
         )
 
+        # 은행별 등급 가중 한도는 check_policy 에서 계산한 값을 그대로 사용
+        limit_by_bank = policy_result.institution_limits
+
         # 여유 있는 은행 (현재 비중 < 등급 가중 한도, 리스크 점수 높은 순으로 정렬)
-        under_banks: List[BankExposure] = []
-        for e in exposures:
-            share = inst_shares[e.bank_id]
-            base_limit = self.policy.max_exposure_per_institution
-            mult = self.policy.rating_limit_multiplier.get(e.credit_rating, 1.0)
-            limit = base_limit * mult
-            if share < limit:
-                under_banks.append(e)
+        under_banks: List[BankExposure] = [
+            e for bank_id, e in bank_map.items()
+            if inst_shares[bank_id] < limit_by_bank[bank_id]
+        ]
 
         under_banks.sort(
             key=lambda e: scores.get(e.bank_id, BankRiskScoreResult(e.bank_id, e.name, 0, {})).score,
             reverse=True,
         )
 
+        # 도착지별 남은 여유 금액 — 앞선 출발지가 채운 만큼 차감된다
+        headroom = [
+            (limit_by_bank[dst.bank_id] - inst_shares[dst.bank_id]) * total
+            for dst in under_banks
+        ]
+
         actions: List[RebalanceAction] = []
+        dst_idx = 0
 
+        # 출발지/도착지 모두 정렬된 상태 → two-pointer 1회 순회
         for src in over_banks:
             src_share = inst_shares[src.bank_id]
-            base_limit = self.policy.max_exposure_per_institution
-            mult = self.policy.rating_limit_multiplier.get(src.credit_rating, 1.0)
-            limit = base_limit * mult
+            limit = limit_by_bank[src.bank_id]
 
             # 얼마나 줄여야 하는가?
             excess_share = src_share - limit
             if excess_share <= 0:
                 continue
 
-            excess_amount = excess_share * total
-            remaining_to_move = excess_amount
-
-            for dst in under_banks:
-                if dst.bank_id == src.bank_id:
-                    continue
-
-                dst_share = inst_shares[dst.bank_id]
-                dst_limit = self.policy.max_exposure_per_institution * self.policy.rating_limit_multiplier.get(
-                    dst.credit_rating, 1.0
-                )
-                headroom_share = max(dst_limit - dst_share, 0.0)
-                if headroom_share <= 0:
-                    continue
-
-                headroom_amount = headroom_share * total
-                move_amount = min(remaining_to_move, headroom_amount)
+            remaining_to_move = excess_share * total
 
-                if move_amount <= 0:
-                    continue
+            while remaining_to_move > 0 and dst_idx < len(under_banks):
+                dst = under_banks[dst_idx]
+                move_amount = min(remaining_to_move, headroom[dst_idx])
 
                 actions.append(
                     RebalanceAction(
                         from_bank_id=src.bank_id,
                         to_bank_id=dst.bank_id,
                         amount=move_amount,
-                        reason=(
-                            f"{src.name} 비중 {src_share:.2%} → 한도 {limit:.2%} 이하로 낮추기 위해, "
-                            f"리스크 점수 더 높은 {dst.name}로 이동 제안"
-                        ),
+                        from_name=src.name,
+                        to_name=dst.name,
+                        from_share=src_share,
+                        from_limit=limit,
                     )
                 )
 
                 remaining_to_move -= move_amount
+                headroom[dst_idx] -= move_amount
 
-                if remaining_to_move <= 0:
-                    break
+                if headroom[dst_idx] <= 0:
+                    dst_idx += 1
 
         comment = "정책 한도 및 리스크 점수를 기준으로 자동 재예치(재밸런싱) 제안을 생성했습니다."
         if not actions:
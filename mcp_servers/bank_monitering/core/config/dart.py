@@ -1,17 +1,30 @@
 # [bank_monitering/core/config/dart.py]
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 class DARTSettings(BaseModel):
     api_key: str
 
 
+# .env 탐색은 프로세스당 1회만 수행
+_ENV_LOADED = False
+
+
 def _load_env_recursive():
     """
     현재 파일 위치를 기준으로 상위 폴더를 올라가며 .env 파일을 탐색해 로드한다.
     """
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+
     # 1️⃣ 시작 경로 = 현재 파일 위치
     current = Path(__file__).resolve().parent
 
@@ -23,9 +36,10 @@ def _load_env_recursive():
             # print(f"✅ Loaded .env from: {env_file}")
             return
     # 3️⃣ 못 찾을 경우에도 조용히 통과
-    print("⚠️ .env not found in any parent directories.")
+    logger.warning("⚠️ .env not found in any parent directories.")
 
 
+@lru_cache(maxsize=1)
 def get_dart_settings() -> DARTSettings:
     """
     DART API 키를 환경변수 또는 .env에서 불러와 반환.
@@ -1,14 +1,28 @@
 # core/db/pool.py
 
+import asyncio
+import logging
 import os
 import ssl
+from functools import lru_cache
 from typing import Optional
 
 import asyncpg
 
+logger = logging.getLogger(__name__)
+
 # 내부에서 재사용할 풀
 _PG_POOL: Optional[asyncpg.Pool] = None
 
+# 동시 첫 호출 시 풀이 두 번 만들어지지 않도록 생성 구간을 잠근다 (커넥션 누수 방지)
+_PG_POOL_LOCK = asyncio.Lock()
+
+# 풀 튜닝: 동시 MCP tool 호출이 커넥션 대기에 막히지 않도록
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "16"))
+PG_STATEMENT_CACHE_SIZE = 1024
+PG_MAX_INACTIVE_LIFETIME_SEC = 300.0
+PG_COMMAND_TIMEOUT_SEC = 30.0
+
 
 def _load_pg_config():
     """
@@ -32,10 +46,12 @@ def _load_pg_config():
     }
 
 
+@lru_cache(maxsize=4)
 def _build_ssl_context(ssl_mode: str):
     """
     Cloud DB(PostgreSQL)가 SSL을 요구할 수 있기 때문에
     ssl_mode=require 인 경우 TLS 컨텍스트를 만든다.
+    (CA 번들 로딩 비용이 있으므로 ssl_mode 별로 1회만 생성)
     """
     if ssl_mode in ("disable", "off", "false", "0"):
         return None
@@ -50,6 +66,11 @@ def _build_ssl_context(ssl_mode: str):
     return ctx
 
 
+# 커넥션 시작 파라미터로 search_path 를 stablecoin 으로 고정
+#  (SET 은 풀 반납 시 asyncpg 의 RESET ALL 로 지워지지만, 시작 파라미터 값은 RESET 후에도 유지됨)
+PG_SERVER_SETTINGS = {"search_path": "stablecoin"}
+
+
 async def get_pool() -> asyncpg.Pool:
     """
     전역 asyncpg 풀 생성/반환.
@@ -58,71 +79,80 @@ async def get_pool() -> asyncpg.Pool:
     if _PG_POOL is not None:
         return _PG_POOL
 
-    cfg = _load_pg_config()
-    ssl_ctx = _build_ssl_context(cfg["ssl_mode"])
-
-    print(
-        f"📡 PostgreSQL connect: host={cfg['host']} port={cfg['port']} "
-        f"user={cfg['user']} db={cfg['database']} ssl_mode={cfg['ssl_mode']}"
-    )
-
-    _PG_POOL = await asyncpg.create_pool(
-        host=cfg["host"],
-        port=cfg["port"],
-        user=cfg["user"],
-        password=cfg["password"],
-        database=cfg["database"],
-        min_size=1,
-        max_size=5,
-        ssl=ssl_ctx,
-    )
+    async with _PG_POOL_LOCK:
+        # 락 대기 중 다른 코루틴이 먼저 만들었으면 그대로 사용
+        if _PG_POOL is not None:
+            return _PG_POOL
+
+        cfg = _load_pg_config()
+        ssl_ctx = _build_ssl_context(cfg["ssl_mode"])
+
+        logger.info(
+            "📡 PostgreSQL connect: host=%s port=%s user=%s db=%s ssl_mode=%s",
+            cfg["host"], cfg["port"], cfg["user"], cfg["database"], cfg["ssl_mode"],
+        )
+
+        _PG_POOL = await asyncpg.create_pool(
+            host=cfg["host"],
+            port=cfg["port"],
+            user=cfg["user"],
+            password=cfg["password"],
+            database=cfg["database"],
+            min_size=max(1, PG_POOL_MAX // 4),
+            max_size=PG_POOL_MAX,
+            statement_cache_size=PG_STATEMENT_CACHE_SIZE,
+            max_inactive_connection_lifetime=PG_MAX_INACTIVE_LIFETIME_SEC,
+            command_timeout=PG_COMMAND_TIMEOUT_SEC,
+            server_settings=PG_SERVER_SETTINGS,
+            ssl=ssl_ctx,
+        )
     return _PG_POOL
 
 
+# 스키마 DDL — 한 번의 execute(단일 왕복)로 전송
+SCHEMA_DDL = """
+    -- 스키마는 이미 존재한다고 했으니 생성은 optional
+    CREATE SCHEMA IF NOT EXISTS stablecoin;
+
+    -- ★ 핵심 — search_path 강제 변경
+    SET search_path TO stablecoin;
+
+    -- 여기부터는 stablecoin 스키마 안에서 테이블 생성됨
+
+    CREATE TABLE IF NOT EXISTS bank_master (
+        bank_id TEXT PRIMARY KEY,
+        name TEXT,
+        group_id TEXT,
+        region TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS fss_snapshots (
+        id SERIAL PRIMARY KEY,
+        bank_id TEXT,
+        fss_score NUMERIC,
+        raw_json JSONB,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+
+    -- 은행별 최신 스냅샷 조회용 (get_latest_fss / get_latest_fss_bulk)
+    CREATE INDEX IF NOT EXISTS ix_fss_snapshots_bank_created
+        ON fss_snapshots (bank_id, created_at DESC);
+
+    CREATE TABLE IF NOT EXISTS risk_runs (
+        id SERIAL PRIMARY KEY,
+        total_exposure NUMERIC,
+        hhi NUMERIC,
+        top3_share NUMERIC,
+        top3_breach BOOLEAN,
+        raw_exposures JSONB,
+        bank_details JSONB,
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+"""
+
+
 async def init_schema():
     pool = await get_pool()
     async with pool.acquire() as conn:
-
-        # 스키마는 이미 존재한다고 했으니 생성은 optional
-        await conn.execute("""
-            CREATE SCHEMA IF NOT EXISTS stablecoin;
-        """)
-
-        # ★ 핵심 — search_path 강제 변경
-        await conn.execute("""
-            SET search_path TO stablecoin;
-        """)
-
-        # 여기부터는 stablecoin 스키마 안에서 테이블 생성됨
-
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS bank_master (
-                bank_id TEXT PRIMARY KEY,
-                name TEXT,
-                group_id TEXT,
-                region TEXT
-            );
-        """)
-
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS fss_snapshots (
-                id SERIAL PRIMARY KEY,
-                bank_id TEXT,
-                fss_score NUMERIC,
-                raw_json JSONB,
-                created_at TIMESTAMP DEFAULT NOW()
-            );
-        """)
-
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS risk_runs (
-                id SERIAL PRIMARY KEY,
-                total_exposure NUMERIC,
-                hhi NUMERIC,
-                top3_share NUMERIC,
-                top3_breach BOOLEAN,
-                raw_exposures JSONB,
-                bank_details JSONB,
-                created_at TIMESTAMP DEFAULT NOW()
-            );
-        """)
\ No newline at end of file
+        async with conn.transaction():
+            await conn.execute(SCHEMA_DDL)
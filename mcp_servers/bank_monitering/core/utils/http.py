@@ -1,15 +1,50 @@
+import asyncio
+from typing import Optional
+
 import httpx
 
 DEFAULT_TIMEOUT = 20.0
 
+# 공용 커넥션 풀 (DART 등 동일 호스트 반복 호출 시 TCP/TLS 핸드셰이크 재사용)
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _close_stale_client(
+    client: Optional[httpx.AsyncClient], loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    교체되는 이전 AsyncClient 정리.
+    이전 루프가 아직 돌고 있으면 그 루프에 aclose() 를 예약한다
+    (이미 닫힌 루프에 묶인 클라이언트는 닫을 방법이 없으므로 참조만 버림).
+    """
+    if client is None or client.is_closed:
+        return
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    프로세스 공용 AsyncClient 반환.
+    AsyncClient는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+    """
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        _close_stale_client(_CLIENT, _CLIENT_LOOP)
+        _CLIENT = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS)
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
 async def get(url: str, params: dict = None, timeout: float = DEFAULT_TIMEOUT) -> dict:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        return r.json()
+    r = await get_client().get(url, params=params, timeout=timeout)
+    r.raise_for_status()
+    return r.json()
 
 async def get_bytes(url: str, params: dict = None, timeout: float = DEFAULT_TIMEOUT) -> bytes:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        return r.content
+    r = await get_client().get(url, params=params, timeout=timeout)
+    r.raise_for_status()
+    return r.content
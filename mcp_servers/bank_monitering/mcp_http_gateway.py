@@ -3,39 +3,24 @@ bank_monitoring MCP HTTP Gateway
 FastMCP 대신 표준 HTTP 엔드포인트로 MCP 툴 제공
 """
 
-from flask import Flask, request, jsonify
-import asyncio
-import threading
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+import logging
+import os
 import traceback
+import uvicorn
 from app_mcp.tools.compute_fss import compute_fss_for_bank, get_latest_fss
 from core.db import init_schema
 
-# =====================================================
-# 글로벌 Event Loop (asyncpg, MCP 툴 공용)
-# =====================================================
-
-GLOBAL_LOOP = asyncio.new_event_loop()
-
-def _run_global_loop(loop: asyncio.AbstractEventLoop) -> None:
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
-
-_loop_thread = threading.Thread(target=_run_global_loop, args=(GLOBAL_LOOP,), daemon=True)
-_loop_thread.start()
-
-
-def run_async(func, *args, **kwargs):
-    """
-    async function을 GLOBAL_LOOP에서 실행.
-    func 자체를 넘겨야 하고, coroutine 넘기면 안됨!!
-    """
-    if asyncio.iscoroutinefunction(func):
-        coro = func(*args, **kwargs)
-        future = asyncio.run_coroutine_threadsafe(coro, GLOBAL_LOOP)
-        return future.result()
-    else:
-        return func(*args, **kwargs)
+logger = logging.getLogger(__name__)
 
+# 운영 설정: MCP_DEBUG=1 이면 디버그 로그, MCP_WORKERS 로 uvicorn 워커 수 지정
+MCP_DEBUG = os.getenv("MCP_DEBUG", "").lower() in ("1", "true", "yes")
+MCP_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
 
 
 # =====================================================
@@ -68,7 +53,7 @@ from app_mcp.tools.policy_check import (
 )
 
 from app_mcp.tools.reserve_role_engine import (
-    Institution,
+    INSTITUTION_LIST_ADAPTER,
     compute_target_allocation,
     compute_rebalance_plan,
 )
@@ -79,24 +64,38 @@ from app_mcp.tools.reserve_role_engine import (
 # 역할 기반 Wrapper
 # =====================================================
 
+def _fast_dump(item):
+    """
+    flat pydantic 모델 → dict.
+    model_dump() 의 serializer 경로를 거치지 않고 필드값을 그대로 꺼낸다.
+    (TargetAllocation 등 필드가 모두 원시 타입인 모델 전용)
+    """
+    if isinstance(item, BaseModel):
+        return {k: getattr(item, k) for k in type(item).model_fields}
+    if isinstance(item, dict):
+        return item
+    return {"value": str(item)}
+
+
 async def role_based_allocation_http(params):
     raw_insts = params.get("institutions", [])
-    insts = []
-
-    fss_map = {}
 
-    for i in raw_insts:
-        bank_id = i.get("bank_id")
-        fss = i.get("fss", None)
-        if fss is not None:
-            fss_map[bank_id] = fss
+    # 입력 fss 는 응답에만 덧붙인다 (배분 계산에는 미사용)
+    fss_map = {
+        i.get("bank_id"): i["fss"]
+        for i in raw_insts
+        if i.get("fss") is not None
+    }
 
-        insts.append(Institution(
-            bank_id=bank_id,
-            name=i.get("name"),
-            exposure=i.get("exposure"),
-            role=i.get("role")
-        ))
+    insts = INSTITUTION_LIST_ADAPTER.validate_python([
+        {
+            "bank_id": i.get("bank_id"),
+            "name": i.get("name"),
+            "exposure": i.get("exposure"),
+            "role": i.get("role"),
+        }
+        for i in raw_insts
+    ])
 
     total = sum(i.exposure for i in insts)
 
@@ -104,7 +103,7 @@ async def role_based_allocation_http(params):
 
     banks_out = []
     for b in result["banks"]:
-        data = b.model_dump()
+        data = _fast_dump(b)
         bank_id = data.get("bank_id")
         if bank_id in fss_map:
             data["fss"] = fss_map[bank_id]
@@ -117,123 +116,172 @@ async def role_based_allocation_http(params):
 
 
 async def role_based_rebalance_http(params):
-
-    def safe_dump(item):
-        if hasattr(item, "model_dump"):
-            return item.model_dump()
-        if isinstance(item, dict):
-            return item
-        return {"value": str(item)}
-
-    insts = [Institution(**i) for i in params.get("institutions", [])]
+    insts = INSTITUTION_LIST_ADAPTER.validate_python(params.get("institutions", []))
     total = sum(i.exposure for i in insts)
 
     targets = compute_target_allocation(insts, total)
     plan = compute_rebalance_plan(insts, targets)
 
+    # banks(TargetAllocation) + custody(dict) 를 평탄화
     return {
-        "targets": [safe_dump(t) for t in targets],
-        "rebalance_plan": [safe_dump(p) for p in plan],
+        "targets": [_fast_dump(t) for t in targets["banks"]] + targets["custody"],
+        "rebalance_plan": [_fast_dump(p) for p in plan],
     }
 
 
 
 # =====================================================
-# TOOL MAP (모두 run_async(func, ...) 로 수정 완료)
+# TOOL MAP
+#  - SYNC_TOOLS  : name → 함수(params) — 바로 호출, await 없음
+#  - ASYNC_TOOLS : name → (함수, params 를 **kwargs 로 펼칠지 여부) — 항상 await
+#  - 단순 전달 툴은 함수를 직접 참조 (요청마다 lambda/dict 생성 없음)
 # =====================================================
 
-TOOL_MAP = {
+# run_bank_stress_test 기본 시나리오 (import 시 1회 생성, 읽기 전용)
+_DEFAULT_STRESS_SCENARIO = {
+    "bank_liquidity_shock": {},
+    "daily_runoff_rate": 0.10,
+    "interest_shock_bps": 0.0,
+}
 
-    "normalize_bank_name": lambda params: {
+
+def _normalize_bank_name_http(params):
+    return {
         "input": params.get("bank_name"),
         "normalized": normalize_name(params.get("bank_name", "")),
-    },
+    }
 
-    "get_bank_risk_score": lambda params: run_async(get_bank_risk_score, **params),
 
-    "run_bank_stress_test": lambda params: run_async(
-        run_bank_stress_test,
-        exposures=params.get("exposures", []),
-        scenario=params.get("scenario", {
-            "bank_liquidity_shock": {},
-            "daily_runoff_rate": 0.10,
-            "interest_shock_bps": 0.0
-        })
-    ),
+async def _run_bank_stress_test_http(params):
+    return await run_bank_stress_test(
+        exposures=params.get("exposures") or [],
+        scenario=params.get("scenario") or _DEFAULT_STRESS_SCENARIO,
+    )
+
+
+async def _get_latest_fss_http(params):
+    return await get_latest_fss({"bank_id": params.get("bank_id")})
+
+
+SYNC_TOOLS = {
+    "normalize_bank_name": _normalize_bank_name_http,
+}
 
-    "suggest_bank_rebalance": lambda params: run_async(suggest_bank_rebalance, **params),
+ASYNC_TOOLS = {
+
+    "get_bank_risk_score": (get_bank_risk_score, True),
+    "run_bank_stress_test": (_run_bank_stress_test_http, False),
+    "suggest_bank_rebalance": (suggest_bank_rebalance, True),
 
     # DART
-    "bank_financials_by_name": lambda params: run_async(bank_financials_by_name, **params),
-    "dart_financials_summary": lambda params: run_async(dart_financials_summary, **params),
-    "calc_bank_ratios": lambda params: run_async(calc_bank_ratios, **params),
+    "bank_financials_by_name": (bank_financials_by_name, True),
+    "dart_financials_summary": (dart_financials_summary, True),
+    "calc_bank_ratios": (calc_bank_ratios, True),
 
     # 공시
-    "resolve_corp_code": lambda params: run_async(resolve_corp_code, **params),
-    "corp_codes_search": lambda params: run_async(corp_codes_search, **params),
+    "resolve_corp_code": (resolve_corp_code, True),
+    "corp_codes_search": (corp_codes_search, True),
 
     # 정책 점검
-    "check_policy_compliance": lambda params: run_async(check_policy_compliance, **params),
-    "get_rebalancing_suggestions": lambda params: run_async(get_rebalancing_suggestions, **params),
+    "check_policy_compliance": (check_policy_compliance, True),
+    "get_rebalancing_suggestions": (get_rebalancing_suggestions, True),
 
     # 역할 기반 엔진
-    "role_based_allocation": lambda params: run_async(role_based_allocation_http, params),
-    "role_based_rebalance": lambda params: run_async(role_based_rebalance_http, params),
+    "role_based_allocation": (role_based_allocation_http, False),
+    "role_based_rebalance": (role_based_rebalance_http, False),
 
     # FSS
-    "compute_fss_for_bank": lambda params: run_async(compute_fss_for_bank, params),
-    "get_latest_fss": lambda params: run_async(get_latest_fss, {"bank_id": params.get("bank_id")}),
+    "compute_fss_for_bank": (compute_fss_for_bank, False),
+    "get_latest_fss": (_get_latest_fss_http, False),
 }
 
+# /health · 시작 로그용 전체 툴 이름
+TOOL_NAMES = [*SYNC_TOOLS, *ASYNC_TOOLS]
 
 
 # =====================================================
 # HTTP Router
 # =====================================================
 
-app = Flask(__name__)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # MCP 툴 / asyncpg 풀은 모두 uvicorn 이벤트 루프 하나에서 동작
+    await init_schema()
+    yield
 
 
-@app.route("/mcp", methods=["POST"])
-def mcp_gateway():
-    try:
-        data = request.json
-        tool_name = data.get("tool")
-        params = data.get("params", {}) or {}
+app = FastAPI(title="Bank Monitoring MCP Gateway", lifespan=lifespan)
 
-        print(f"🔧 MCP 호출: {tool_name}({params})")
 
-        if tool_name not in TOOL_MAP:
-            return jsonify({
-                "success": False,
-                "error": f"Unknown tool: {tool_name}",
-            }), 404
+def _json_response(body, status_code: int = 200) -> Response:
+    """
+    dict → JSON bytes 를 pydantic-core 직렬화기로 한 번에 만들어 그대로 응답.
+    (FastAPI 기본 경로의 jsonable_encoder + json.dumps 2단계 변환 생략)
+    알 수 없는 타입은 str() 로 직렬화한다.
+    """
+    return Response(
+        to_json(body, serialize_unknown=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
-        result = TOOL_MAP[tool_name](params)
+class MCPRequest(BaseModel):
+    """POST /mcp 요청 바디 ({tool, params})"""
+    tool: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
 
-        print(f"✅ 툴 실행 성공: {tool_name}")
 
-        return jsonify({
+@app.post("/mcp")
+async def mcp_gateway(request: Request):
+    try:
+        # 바디 bytes 를 pydantic-core JSON 파서로 바로 디코딩 + 형태 검증
+        req = MCPRequest.model_validate_json(await request.body())
+        tool_name = req.tool
+        params = req.params or {}
+
+        logger.debug("🔧 MCP 호출: %s", tool_name)
+
+        # dict 조회로 존재 확인 + 핸들러 획득 (sync → async 순)
+        sync_func = SYNC_TOOLS.get(tool_name)
+        if sync_func is not None:
+            result = sync_func(params)
+        else:
+            entry = ASYNC_TOOLS.get(tool_name)
+            if entry is None:
+                return _json_response({
+                    "success": False,
+                    "error": f"Unknown tool: {tool_name}",
+                }, status_code=404)
+
+            func, spread_kwargs = entry
+            result = await (func(**params) if spread_kwargs else func(params))
+
+        logger.debug("✅ 툴 실행 성공: %s", tool_name)
+
+        return _json_response({
             "success": True,
             "result": result,
         })
 
     except Exception as e:
-        print(f"❌ MCP Gateway 에러: {e}")
-        traceback.print_exc()
-        return jsonify({
+        logger.exception("❌ MCP Gateway 에러: %s", e)
+        body = {
             "success": False,
             "error": str(e),
-            "traceback": traceback.format_exc(),
-        }), 500
+        }
+        # traceback 문자열은 디버그 모드에서만 응답에 포함 (서버 로그에는 항상 남음)
+        if MCP_DEBUG:
+            body["traceback"] = traceback.format_exc()
+        return _json_response(body, status_code=500)
 
 
-@app.route("/health", methods=["GET"])
-def health():
-    return jsonify({
+@app.get("/health")
+async def health():
+    return {
         "status": "healthy",
-        "tools": list(TOOL_MAP.keys())
-    })
+        "tools": TOOL_NAMES
+    }
 
 
 
@@ -242,16 +290,24 @@ def health():
 # =====================================================
 
 if __name__ == "__main__":
-    # init_schema도 coroutine → run_async(func)
-    run_async(init_schema)
+    # init_schema 는 lifespan 에서 수행
 
     print("=" * 70)
     print("🚀 Bank Monitoring MCP HTTP Gateway")
     print("=" * 70)
     print("📍 Endpoint: http://localhost:5300/mcp")
     print("🛠 Available Tools:")
-    for tool in TOOL_MAP.keys():
+    for tool in TOOL_NAMES:
         print(f" - {tool}")
     print("=" * 70)
 
-    app.run(host="0.0.0.0", port=5300, debug=True)
+    # 워커 여러 개로 띄우려면 import 문자열로 넘겨야 함
+    # (동일: uvicorn mcp_http_gateway:app --host 0.0.0.0 --port 5300 --workers 4)
+    logging.basicConfig(level=logging.DEBUG if MCP_DEBUG else logging.INFO)
+    uvicorn.run(
+        "mcp_http_gateway:app",
+        host="0.0.0.0",
+        port=5300,
+        workers=MCP_WORKERS,
+        log_level="debug" if MCP_DEBUG else "info",
+    )
@@ -129,6 +129,10 @@ async def list_tools() -> list[Tool]:
     return TOOLS
 
 
+# get_risk_report summary 모드에서 내보낼 RiskReport 필드
+_REPORT_SUMMARY_FIELDS = {"timestamp", "summary", "risk_factors", "recommendations"}
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Tool 실행"""
@@ -138,12 +142,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             refresh = arguments.get("refresh", False)
             scenario = arguments.get("scenario", "normal")
             
-            result = get_onchain_state(refresh=refresh, scenario=scenario)
+            result = await get_onchain_state(refresh=refresh, scenario=scenario)
             
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(result.model_dump(), indent=2, ensure_ascii=False, default=str)
+                    text=result.model_dump_json(indent=2)
                 )
             ]
         
@@ -151,24 +155,24 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             refresh = arguments.get("refresh", False)
             scenario = arguments.get("scenario", "normal")
             
-            result = get_offchain_reserves(refresh=refresh, scenario=scenario)
+            result = await get_offchain_reserves(refresh=refresh, scenario=scenario)
             
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(result.model_dump(), indent=2, ensure_ascii=False, default=str)
+                    text=result.model_dump_json(indent=2)
                 )
             ]
         
         elif name == "check_coverage":
             scenario = arguments.get("scenario", "normal")
             
-            result = check_coverage(scenario=scenario)
+            result = await check_coverage(scenario=scenario)
             
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(result.model_dump(), indent=2, ensure_ascii=False, default=str)
+                    text=result.model_dump_json(indent=2)
                 )
             ]
         
@@ -176,28 +180,21 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             scenario = arguments.get("scenario", "normal")
             format_type = arguments.get("format", "detailed")
             
-            result = get_risk_report(scenario=scenario, format_type=format_type)
+            result = await get_risk_report(scenario=scenario, format_type=format_type)
             
-            # summary 모드인 경우 일부만 반환
+            # summary 모드인 경우 일부만 반환 (필드 선택 + 직렬화를 pydantic-core 1회로)
             if format_type == "summary":
-                summary_data = {
-                    "report_id": result.report_id,
-                    "generated_at": str(result.generated_at),
-                    "summary": result.summary.model_dump(),
-                    "risk_factors": [rf.model_dump() for rf in result.risk_factors],
-                    "recommendations": result.recommendations
-                }
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(summary_data, indent=2, ensure_ascii=False, default=str)
+                        text=result.model_dump_json(indent=2, include=_REPORT_SUMMARY_FIELDS)
                     )
                 ]
             
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(result.model_dump(), indent=2, ensure_ascii=False, default=str)
+                    text=result.model_dump_json(indent=2)
                 )
             ]
         
@@ -5,11 +5,12 @@ MCP Tools 패키지
 from app_mcp.tools.onchain import get_onchain_state
 from app_mcp.tools.offchain import get_offchain_reserves
 from app_mcp.tools.coverage import check_coverage
-from app_mcp.tools.report import get_risk_report
+from app_mcp.tools.report import get_risk_report, get_risk_report_dict
 
 __all__ = [
     "get_onchain_state",
     "get_offchain_reserves",
     "check_coverage",
     "get_risk_report",
+    "get_risk_report_dict",
 ]
\ No newline at end of file
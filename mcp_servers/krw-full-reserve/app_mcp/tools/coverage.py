@@ -10,7 +10,7 @@ from app_mcp.tools.onchain import get_onchain_state
 from app_mcp.tools.offchain import get_offchain_reserves
 
 
-def check_coverage(
+async def check_coverage(
     on_chain: Optional[OnChainState] = None,
     off_chain: Optional[OffChainReserves] = None,
     scenario: str = "normal"
@@ -27,12 +27,12 @@ def check_coverage(
         CoverageCheck: 담보율 검증 결과
     """
 
-    # 1) 데이터가 없으면 자동 조회
+    # 1) 데이터가 없으면 자동 조회 (API_CACHE_TTL 이내 직전 응답은 재사용)
     if on_chain is None:
-        on_chain = get_onchain_state(scenario=scenario)
+        on_chain = await get_onchain_state(refresh=False, scenario=scenario)
 
     if off_chain is None:
-        off_chain = get_offchain_reserves(scenario=scenario)
+        off_chain = await get_offchain_reserves(refresh=False, scenario=scenario)
 
     if on_chain is None or off_chain is None:
         raise ValueError("온체인 또는 오프체인 데이터가 없습니다.")
@@ -1,12 +1,176 @@
 # app_mcp/tools/history.py
-from typing import Optional, Literal
+import time
+from typing import Any, Dict, Optional, Literal, Tuple
 from datetime import datetime
-from core.db import get_pool
+from core.db import get_pool, register_warm_query
 
 
 Metric = Literal["all", "coverage", "onchain", "offchain"]
 
 
+# ─────────────────────────────────────────────
+# metric → 응답 키 (SELECT 순서 그대로)
+#  metric 에 필요한 컬럼만 DB 에서 가져온다. (허용 목록 기반 — 사용자 입력은 SQL 에 들어가지 않음)
+#  timestamp 는 ORDER BY 가 원본 컬럼(인덱스)을 쓰도록 별칭을 ts 로 둔다.
+#  timestamp 문자열은 기존 응답과 같도록 Python datetime.isoformat() 으로 만든다
+#  (마이크로초 0 이면 소수부 생략, 컬럼 타입에 따른 오프셋 유무 그대로).
+# ─────────────────────────────────────────────
+_COLUMN_SQL = {
+    "timestamp": "timestamp AS ts",
+    "coverage_ratio": "coverage_ratio::float8 AS coverage_ratio",
+    "reserves_krw": "reserves_krw::float8 AS reserves_krw",
+    "offchain_supply_krw": "offchain_supply_krw::float8 AS offchain_supply_krw",
+    "onchain_price": "onchain_price::float8 AS onchain_price",
+    "theoretical_price": "theoretical_price::float8 AS theoretical_price",
+}
+
+_COVERAGE_COLS = ("coverage_ratio", "reserves_krw", "offchain_supply_krw")
+_ONCHAIN_COLS = ("onchain_price", "theoretical_price")
+
+_METRIC_COLUMNS = {
+    "all": _COVERAGE_COLS + _ONCHAIN_COLS,
+    "coverage": _COVERAGE_COLS,
+    "offchain": _COVERAGE_COLS,
+    "onchain": _ONCHAIN_COLS,
+}
+
+
+def _metric_keys(metric: str) -> tuple:
+    # 알 수 없는 metric 은 timestamp 만
+    return ("timestamp",) + _METRIC_COLUMNS.get(metric, ())
+
+
+# ─────────────────────────────────────────────
+# SQL 템플릿 — (선택 컬럼, from_ts 유무, to_ts 유무) 별로 미리 생성
+#  "$1 IS NULL OR timestamp >= $1" 형태는 플래너가 timestamp 인덱스를
+#  제대로 쓰지 못하므로, 실제로 주어진 조건만 WHERE 에 넣는다.
+#  float 캐스팅은 SQL 에서 처리 → Python 행 루프는 timestamp.isoformat() 외에는 값만 옮긴다.
+# ─────────────────────────────────────────────
+
+def _build_history_sql(keys: tuple, has_from: bool, has_to: bool) -> str:
+    conds = []
+    n = 0
+    if has_from:
+        n += 1
+        conds.append(f"timestamp >= ${n}::timestamptz")
+    if has_to:
+        n += 1
+        conds.append(f"timestamp <= ${n}::timestamptz")
+
+    where = f"WHERE {' AND '.join(conds)}" if conds else ""
+    select = ",\n        ".join(_COLUMN_SQL[k] for k in keys)
+
+    return f"""
+        SELECT
+        {select}
+        FROM stablecoin.full_reserve_history_mv
+        {where}
+        ORDER BY timestamp DESC
+        LIMIT ${n + 1}
+    """
+
+
+_HISTORY_SQL = {
+    (keys, has_from, has_to): _build_history_sql(keys, has_from, has_to)
+    for keys in {_metric_keys(m) for m in (*_METRIC_COLUMNS, None)}
+    for has_from in (False, True)
+    for has_to in (False, True)
+}
+
+
+# 기본 metric("all") 쿼리는 새 풀 커넥션마다 미리 준비 (NULL 범위 + LIMIT 0 → 행 조회 없음)
+for (_keys, _has_from, _has_to), _sql in _HISTORY_SQL.items():
+    if _keys == _metric_keys("all"):
+        register_warm_query(_sql, *([None] * (_has_from + _has_to)), 0)
+
+
+def _row_builder(metric: str):
+    """metric 에 맞는 행 → dict 변환 함수를 반환. (SELECT 가 이미 필요한 컬럼만 순서대로 반환)"""
+    rest = _METRIC_COLUMNS.get(metric, ())
+
+    def build(r):
+        values = iter(r)
+        point = {"timestamp": next(values).isoformat()}
+        point.update(zip(rest, values))
+        return point
+
+    return build
+
+
+def _history_query(metric: str, from_ts, to_ts, limit: int):
+    """metric / (from_ts, to_ts) 유무에 맞는 SQL 과 바인딩 인자."""
+    sql = _HISTORY_SQL[(_metric_keys(metric), from_ts is not None, to_ts is not None)]
+    args = [ts for ts in (from_ts, to_ts) if ts is not None]
+    args.append(limit)
+    return sql, args
+
+
+# 스트리밍 조회 시 서버 사이드 커서에서 한 번에 가져올 행 수
+HISTORY_STREAM_CHUNK = 500
+
+
+# ─────────────────────────────────────────────
+# 결과 TTL 캐시
+#  - 대시보드/채팅 새로고침이 같은 (metric, from_ts, to_ts, limit) 로 반복 호출
+#  - MV 는 스냅샷 주기로만 갱신되므로 짧은 TTL 동안은 직전 결과 재사용
+# ─────────────────────────────────────────────
+HISTORY_CACHE_TTL = 15.0  # 초
+HISTORY_CACHE_MAX = 128
+
+# key → (조회 시각, 결과)
+_CACHE: Dict[tuple, Tuple[float, Any]] = {}
+
+
+def history_cache_key(
+    metric: Metric = "all",
+    from_ts: Optional[str] = None,
+    to_ts: Optional[str] = None,
+    limit: int = 1000,
+) -> tuple:
+    """조회 인자 → 캐시 키 (기본값 포함, 잘못된 인자면 TypeError)."""
+    return (metric, from_ts, to_ts, limit)
+
+
+def cache_get(cache: Dict[tuple, Tuple[float, Any]], key: tuple):
+    """TTL 이내 캐시 값, 없거나 만료되면 None."""
+    cached = cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < HISTORY_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def cache_put(cache: Dict[tuple, Tuple[float, Any]], key: tuple, value: Any) -> None:
+    """캐시 저장. 가득 차면 가장 먼저 들어간 항목부터 제거."""
+    cache.pop(key, None)
+    while len(cache) >= HISTORY_CACHE_MAX:
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (time.monotonic(), value)
+
+
+async def iter_full_reserve_history(
+    metric: Metric = "all",
+    from_ts: Optional[str] = None,
+    to_ts: Optional[str] = None,
+    limit: int = 1000,
+    chunk_size: int = HISTORY_STREAM_CHUNK,
+):
+    """
+    fetch_full_reserve_history 의 스트리밍 버전.
+    서버 사이드 커서로 chunk_size 행씩 읽어 point dict 리스트를 yield 한다.
+    (전체 결과를 Record 리스트로 한 번에 올리지 않음 → 큰 limit 에서도 메모리 일정)
+    """
+    pool = await get_pool()
+    sql, args = _history_query(metric, from_ts, to_ts, limit)
+    build = _row_builder(metric)
+
+    async with pool.acquire() as conn:
+        # 커서는 트랜잭션 안에서만 사용 가능
+        async with conn.transaction():
+            cur = await conn.cursor(sql, *args)
+            while rows := await cur.fetch(chunk_size):
+                yield list(map(build, rows))
+
+
 async def fetch_full_reserve_history(
     metric: Metric = "all",
     from_ts: Optional[str] = None,
@@ -22,67 +186,32 @@ async def fetch_full_reserve_history(
         "onchain"   : 온체인 가격/이론가만
         "offchain"  : 오프체인 발행량만
     - from_ts, to_ts: ISO8601 문자열 (예: "2025-11-26T00:00:00Z")
+    - HISTORY_CACHE_TTL 이내 같은 인자 재호출 시 DB 조회 없이 직전 결과 반환
     """
+    key = history_cache_key(metric, from_ts, to_ts, limit)
+    cached = cache_get(_CACHE, key)
+    if cached is not None:
+        return cached
 
     pool = await get_pool()
+    sql, args = _history_query(metric, from_ts, to_ts, limit)
 
     async with pool.acquire() as conn:
-        sql = """
-                SELECT
-                timestamp,
-                coverage_ratio,
-                reserves_krw,
-                offchain_supply_krw,
-                onchain_price,
-                theoretical_price
-                FROM stablecoin.full_reserve_history_mv
-                WHERE ($1::timestamptz IS NULL OR timestamp >= $1::timestamptz)
-                AND ($2::timestamptz IS NULL OR timestamp <= $2::timestamptz)
-                ORDER BY timestamp DESC
-                LIMIT $3
-            """
-
-        rows = await conn.fetch(sql, from_ts, to_ts, limit)
-
-
-    points = []
-    for r in rows:
-        item: dict = {
-            "timestamp": r["timestamp"].isoformat(),
-        }
-
-        if metric in ("all", "coverage", "offchain"):
-            item["coverage_ratio"] = (
-                float(r["coverage_ratio"]) if r["coverage_ratio"] is not None else None
-            )
-            item["reserves_krw"] = (
-                float(r["reserves_krw"]) if r["reserves_krw"] is not None else None
-            )
-            item["offchain_supply_krw"] = (
-                float(r["offchain_supply_krw"])
-                if r["offchain_supply_krw"] is not None
-                else None
-            )
-
-        if metric in ("all", "onchain"):
-            item["onchain_price"] = (
-                float(r["onchain_price"]) if r["onchain_price"] is not None else None
-            )
-            item["theoretical_price"] = (
-                float(r["theoretical_price"])
-                if r["theoretical_price"] is not None
-                else None
-            )
-
-        points.append(item)
-
-    return {
+        rows = await conn.fetch(sql, *args)
+
+
+    # 숫자 값은 SQL 에서 이미 float(NULL → None)로 변환됨
+    points = list(map(_row_builder(metric), rows))
+
+    result = {
         "metric": metric,
         "from": from_ts,
         "to": to_ts,
         "count": len(points),
         "points": points,
     }
+    cache_put(_CACHE, key, result)
+    return result
 
 
 # 🔽🔽🔽 여기부터만 새로 추가 🔽🔽🔽
@@ -3,10 +3,12 @@ Tool 2: get_offchain_reserves
 금융기관에서 오프체인 준비금 조회 (백엔드 API 연동)
 """
 
-import requests
-from typing import Optional
-from datetime import datetime
-from config.api_config import API_ENDPOINTS, API_TIMEOUT
+import time
+import httpx
+from typing import Dict, Optional, Tuple
+from core.clock import now_iso
+from config.api_config import API_ENDPOINTS, API_CACHE_TTL
+from config.http_client import get_client
 from core.types import (
     Custodian,
     OffChainReserves,
@@ -15,8 +17,11 @@ from core.types import (
     CreditRating,
 )
 
+# scenario → (조회 시각, OffChainReserves) — 짧은 TTL 캐시
+_CACHE: Dict[str, Tuple[float, OffChainReserves]] = {}
 
-def get_offchain_reserves(
+
+async def get_offchain_reserves(
     refresh: bool = True,
     scenario: str = "normal",
     institution_filter: Optional[str] = None
@@ -33,7 +38,7 @@ def get_offchain_reserves(
         OffChainReserves: 금융기관 담보 데이터 
     
     Examples:
-        >>> reserves = get_offchain_reserves()
+        >>> reserves = await get_offchain_reserves()
         >>> print(f"총 준비금: {reserves.total_reserves:,.0f}원")
         총 준비금: 300,000원
         
@@ -46,12 +51,14 @@ def get_offchain_reserves(
     Raises:
         APIError: API 호출 실패 시
     """
+    if not refresh:
+        cached = _CACHE.get(scenario)
+        if cached is not None and time.monotonic() - cached[0] < API_CACHE_TTL:
+            return cached[1]
+
     try:
         # /banks 엔드포인트에서 은행 준비금 데이터 가져오기
-        response = requests.get(
-            API_ENDPOINTS["banks"],
-            timeout=API_TIMEOUT
-        )
+        response = await get_client().get(API_ENDPOINTS["banks"])
         response.raise_for_status()
         data = response.json()
         
@@ -67,31 +74,35 @@ def get_offchain_reserves(
         # }
         
         # Custodian 객체 생성
-        custodians = []
-        for bank in data["banks"]:
-            custodian = Custodian(
+        # 내부 백엔드 응답이므로 pydantic 검증은 생략(model_construct)하고,
+        # 검증기가 하던 "음수 → 0, 정수화" 보정만 직접 적용
+        custodians = [
+            Custodian.model_construct(
                 id=bank["id"],
                 name=bank["name"],
-                balance=bank["balance"],
+                balance=max(0, int(bank["balance"])),
                 credit_rating=CreditRating.AA_MINUS,  # 백엔드에 신용등급 없으면 기본값
                 risk_weight=bank["weight"]
             )
-            custodians.append(custodian)
+            for bank in data["banks"]
+        ]
         
         # OffChainReserves 객체 구성
-        off_chain = OffChainReserves(
-            total_reserves=data["totalReserves"],
-            institutions=InstitutionGroup(
+        off_chain = OffChainReserves.model_construct(
+            total_reserves=max(0, int(data["totalReserves"])),
+            institutions=InstitutionGroup.model_construct(
                 primary_custodians=custodians,
                 secondary_custodians=[]  # 백엔드에 2차 기관 없으면 빈 리스트
             ),
-            timestamp=datetime.now().isoformat()  # ← 필수 필드 추가, ISO 형식 문자열
+            timestamp=now_iso()  # ← 필수 필드 추가, ISO 형식 문자열
         )
         
+        _CACHE[scenario] = (time.monotonic(), off_chain)
+
         print(f"✅ 오프체인 데이터 조회 성공: 총 준비금 {off_chain.total_reserves:,.0f}원")
         return off_chain
         
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"❌ API 호출 실패 (/banks): {e}")
         raise APIError(f"오프체인 데이터 조회 실패: {e}")
     except KeyError as e:
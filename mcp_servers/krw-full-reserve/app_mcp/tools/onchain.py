@@ -3,14 +3,20 @@ Tool 1: get_onchain_state
 원화스테이블 운영 센터에서 K-WON 온체인 상태 조회 
 """
 
-import requests
-from typing import Optional
-from datetime import datetime
+import asyncio
+import time
+import httpx
+from typing import Dict, Optional, Tuple
+from core.clock import now_iso
 from core.types import Supply, APIError, BlockInfo, OnChainState
-from config.api_config import API_ENDPOINTS, API_TIMEOUT
+from config.api_config import API_ENDPOINTS, API_CACHE_TTL
+from config.http_client import get_client
 
+# scenario → (조회 시각, OnChainState) — 짧은 TTL 캐시
+_CACHE: Dict[str, Tuple[float, OnChainState]] = {}
 
-def get_onchain_state(refresh: bool = True, scenario: str = "normal") -> Optional[OnChainState]:
+
+async def get_onchain_state(refresh: bool = True, scenario: str = "normal") -> Optional[OnChainState]:
     """
     온체인 상태 조회 
     
@@ -22,27 +28,30 @@ def get_onchain_state(refresh: bool = True, scenario: str = "normal") -> Optiona
         OnChainState: 온체인 데이터 (백엔드 API에서 가져옴)
     
     Examples:
-        >>> state = get_onchain_state()
+        >>> state = await get_onchain_state()
         >>> print(f"총 발행량: {state.supply.total:,.0f}원")
         총 발행량: 320,000원
     
     Raises:
         APIError: API 호출 실패 시
     """
+    if not refresh:
+        cached = _CACHE.get(scenario)
+        if cached is not None and time.monotonic() - cached[0] < API_CACHE_TTL:
+            return cached[1]
+
     try:
-        # 1. /status 엔드포인트에서 온체인 기본 정보 가져오기
-        status_response = requests.get(
-            API_ENDPOINTS["status"],
-            timeout=API_TIMEOUT
+        # 1. /status(온체인 기본 정보) + /metrics(발행량) 동시 조회
+        #    → 지연시간이 두 RTT의 합이 아니라 max 로 줄어듦
+        client = get_client()
+        status_response, metrics_response = await asyncio.gather(
+            client.get(API_ENDPOINTS["status"]),
+            client.get(API_ENDPOINTS["metrics"]),
         )
         status_response.raise_for_status()
         status_data = status_response.json()
         
-        # 2. /metrics 엔드포인트에서 발행량 가져오기
-        metrics_response = requests.get(
-            API_ENDPOINTS["metrics"],
-            timeout=API_TIMEOUT
-        )
+        # 2. /metrics 응답에서 발행량 가져오기
         metrics_response.raise_for_status()
         metrics_data = metrics_response.json()
         
@@ -57,16 +66,18 @@ def get_onchain_state(refresh: bool = True, scenario: str = "normal") -> Optiona
             ),
             block=BlockInfo(
                 number=0,  # 블록 번호 (백엔드 API에 없으면 0)
-                timestamp=datetime.now().isoformat(),  # ISO 형식 문자열로 변경
+                timestamp=now_iso(),  # ISO 형식 문자열로 변경
                 hash="0x" + "0" * 64  # 더미 해시
             ),
             contract_address=status_data.get("tokenAddress", "0x0")  # ← 필드명 수정
         )
         
+        _CACHE[scenario] = (time.monotonic(), on_chain)
+
         print(f"✅ 온체인 데이터 조회 성공: 발행량 {on_chain.supply.total:,.0f}원")
         return on_chain
         
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"❌ API 호출 실패 (/status, /metrics): {e}")
         raise APIError(f"온체인 데이터 조회 실패: {e}")
     except KeyError as e:
@@ -3,15 +3,15 @@ Tool 4: get_risk_report
 종합 리스크 리포트 생성
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from core.types import OnChainState, OffChainReserves, CoverageCheck, RiskReport
-from core.calculator import create_risk_report
+from core.calculator import create_risk_report, create_risk_report_dict
 from app_mcp.tools.onchain import get_onchain_state
 from app_mcp.tools.offchain import get_offchain_reserves
 from app_mcp.tools.coverage import check_coverage
 
 
-def get_risk_report(
+async def get_risk_report(
     on_chain: Optional[OnChainState] = None,
     off_chain: Optional[OffChainReserves] = None,
     coverage: Optional[CoverageCheck] = None,
@@ -33,33 +33,67 @@ def get_risk_report(
     
     Examples:
         >>> # 자동 모드 (모든 데이터 자동 생성)
-        >>> report = get_risk_report(scenario="normal")
+        >>> report = await get_risk_report(scenario="normal")
         >>> print(f"리스크 레벨: {report.summary.risk_level}")
         리스크 레벨: LOW
         
         >>> # 요약 모드
-        >>> report = get_risk_report(scenario="critical", format_type="summary")
+        >>> report = await get_risk_report(scenario="critical", format_type="summary")
         >>> for risk in report.risk_factors:
         ...     print(f"- {risk.category}: {risk.description}")
         - 담보 부족: 담보율 97.00%로 기준 미달
         
         >>> # 수동 모드 (데이터 미리 조회)
-        >>> on_chain = get_onchain_state()
-        >>> off_chain = get_offchain_reserves()
-        >>> coverage = check_coverage(on_chain, off_chain)
-        >>> report = get_risk_report(on_chain, off_chain, coverage)
+        >>> on_chain = await get_onchain_state()
+        >>> off_chain = await get_offchain_reserves()
+        >>> coverage = await check_coverage(on_chain, off_chain)
+        >>> report = await get_risk_report(on_chain, off_chain, coverage)
         >>> print(report.recommendations)
         ['현재 운영 체제 유지', '일일 1회 담보율 모니터링']
     """
-    # 데이터가 제공되지 않으면 자동 조회
+    on_chain, off_chain, coverage = await _resolve_inputs(
+        on_chain, off_chain, coverage, scenario
+    )
+    
+    # 리스크 리포트 생성
+    report = create_risk_report(on_chain, off_chain, coverage, format_type)
+    
+    return report
+
+
+async def get_risk_report_dict(
+    on_chain: Optional[OnChainState] = None,
+    off_chain: Optional[OffChainReserves] = None,
+    coverage: Optional[CoverageCheck] = None,
+    scenario: str = "normal",
+    format_type: str = "detailed"
+) -> Dict:
+    """
+    get_risk_report 와 동일한 리포트를 plain dict 로 반환 (RiskReport 모델 생성 생략).
+    HTTP 게이트웨이처럼 결과를 바로 JSON 으로 내보내는 경로용.
+    """
+    on_chain, off_chain, coverage = await _resolve_inputs(
+        on_chain, off_chain, coverage, scenario
+    )
+    return create_risk_report_dict(on_chain, off_chain, coverage)
+
+
+async def _resolve_inputs(
+    on_chain: Optional[OnChainState],
+    off_chain: Optional[OffChainReserves],
+    coverage: Optional[CoverageCheck],
+    scenario: str,
+):
+    """리포트 입력 데이터 준비 (없는 항목만 조회/계산)"""
+    # 데이터가 제공되지 않으면 자동 조회 (API_CACHE_TTL 이내 직전 응답은 재사용)
     if on_chain is None:
-        on_chain = get_onchain_state(scenario=scenario)
+        on_chain = await get_onchain_state(refresh=False, scenario=scenario)
     
     if off_chain is None:
-        off_chain = get_offchain_reserves(scenario=scenario)
+        off_chain = await get_offchain_reserves(refresh=False, scenario=scenario)
     
     if coverage is None:
-        coverage = check_coverage(on_chain, off_chain, scenario=scenario)
+        coverage = await check_coverage(on_chain, off_chain, scenario=scenario)
     
     if on_chain is None or off_chain is None or coverage is None:
         raise ValueError(
@@ -67,7 +101,4 @@ def get_risk_report(
             "get_onchain_state(), get_offchain_reserves(), check_coverage()를 먼저 호출하세요."
         )
     
-    # 리스크 리포트 생성
-    report = create_risk_report(on_chain, off_chain, coverage, format_type)
-    
-    return report
\ No newline at end of file
+    return on_chain, off_chain, coverage
\ No newline at end of file
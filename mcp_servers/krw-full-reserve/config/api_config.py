@@ -22,4 +22,5 @@ API_ENDPOINTS = {
 
 # API 호출 공통 설정
 API_TIMEOUT = 5  # 초
-API_RETRY_COUNT = 3
\ No newline at end of file
+API_RETRY_COUNT = 3
+API_CACHE_TTL = 1.0  # 초 — refresh=False 조회 시 직전 응답 재사용
\ No newline at end of file
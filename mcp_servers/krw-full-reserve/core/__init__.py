@@ -17,6 +17,7 @@ from .types import (
     OffChainReserves,
     Verdict,
     CoverageCheck,
+    RiskCategory,
     RiskFactor,
     RiskSummary,
     RiskReport,
@@ -29,8 +30,10 @@ Institutions = InstitutionGroup  # ← import 후에 별칭 생성
 from .calculator import (
     calculate_coverage,
     analyze_risk,
+    analyze_risk_level_batch,
     generate_recommendations,
     create_risk_report,
+    create_risk_report_dict,
 )
 
 # 상수들
@@ -41,7 +44,9 @@ from .constants import (
     CONCENTRATION_MAX_PRIMARY,
     LIQUIDITY_MIN_RATIO,
     RISK_LEVEL_THRESHOLDS,
+    RISK_BANDS,
     INSTITUTIONS,
+    INSTITUTION_MODELS,
     STABLECOIN_INFO,
 )
 
@@ -60,14 +65,17 @@ __all__ = [
     "OffChainReserves",
     "Verdict",
     "CoverageCheck",
+    "RiskCategory",
     "RiskFactor",
     "RiskSummary",
     "RiskReport",
     # Calculator
     "calculate_coverage",
     "analyze_risk",
+    "analyze_risk_level_batch",
     "generate_recommendations",
     "create_risk_report",
+    "create_risk_report_dict",
     # Constants
     "COVERAGE_CRITICAL",
     "COVERAGE_WARNING",
@@ -75,6 +83,8 @@ __all__ = [
     "CONCENTRATION_MAX_PRIMARY",
     "LIQUIDITY_MIN_RATIO",
     "RISK_LEVEL_THRESHOLDS",
+    "RISK_BANDS",
     "INSTITUTIONS",
+    "INSTITUTION_MODELS",
     "STABLECOIN_INFO",
 ]
\ No newline at end of file
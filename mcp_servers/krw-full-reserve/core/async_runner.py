@@ -0,0 +1,43 @@
+"""
+동기(Flask) 코드에서 async 툴을 실행하기 위한 공용 이벤트 루프
+- 요청마다 asyncio.run() 으로 루프를 새로 만들면 asyncpg 풀(core.db._pool)이
+  이전 루프에 묶여 재사용되지 못하므로, 프로세스당 루프 1개를 백그라운드 스레드에서 돌린다.
+- 여러 Flask 워커 스레드가 동시에 코루틴을 넣을 수 있다 (run_coroutine_threadsafe).
+"""
+
+import asyncio
+import threading
+
+__all__ = ("loop", "run_async", "iter_async")
+
+# ─────────────────────────────────────────────
+# 글로벌 이벤트 루프 생성 + 백그라운드 스레드에서 실행
+# ─────────────────────────────────────────────
+loop = asyncio.new_event_loop()
+threading.Thread(target=loop.run_forever, name="krws-async-loop", daemon=True).start()
+
+
+def run_async(func, **kwargs):
+    """
+    async 함수면 글로벌 event loop 에서 thread-safe 로 실행하고 결과를 기다린다.
+    sync 함수면 호출 스레드에서 바로 실행.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return asyncio.run_coroutine_threadsafe(func(**kwargs), loop).result()
+    return func(**kwargs)
+
+
+def iter_async(agen):
+    """
+    async generator → 동기 iterator.
+    항목마다 글로벌 event loop 에서 다음 값을 꺼내 오고,
+    소비가 끝나거나 중단되면(클라이언트 연결 종료 등) generator 를 닫아 자원을 정리한다.
+    """
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
@@ -5,14 +5,18 @@
 - 권고사항 생성
 """
 
-from datetime import datetime
-from typing import List, Tuple
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.clock import now_iso
 
 from core.types import (
     OnChainState,
     OffChainReserves,
     CoverageCheck,
     Verdict,
+    RiskCategory,
+    RISK_CATEGORY_FLAGS,
     RiskFactor,
     RiskSummary,
     RiskReport,
@@ -23,10 +27,29 @@ from core.constants import (
     COVERAGE_OPTIMAL,
     CONCENTRATION_MAX_PRIMARY,
     LIQUIDITY_MIN_RATIO,
-    RISK_LEVEL_THRESHOLDS,
+    RISK_BANDS,
+)
+
+
+# 담보율 구간 → (Verdict.status, 메시지 접미사)
+#  임계값 내림차순, 첫 번째로 coverage_ratio >= 임계값 인 구간 사용
+#  담보율은 % × 10_000 정수 스케일로 비교 (예: 115.0% → 1_150_000)
+_RATIO_SCALE = 10_000
+
+_COVERAGE_STATUS_TABLE = (
+    (round(COVERAGE_OPTIMAL * _RATIO_SCALE), "OK", "정상 운영 중"),
+    (round(COVERAGE_WARNING * _RATIO_SCALE), "WARNING", "주의 필요 (모니터링 강화 권장)"),
+    (round(COVERAGE_CRITICAL * _RATIO_SCALE), "WARNING", "기준 근접, 추가 담보 확보 검토 필요"),
+    (float("-inf"), "DEFICIT", "긴급 조치 필요 (담보 부족)"),
 )
 
 
+# RiskFactor.description 템플릿 (bound str.format)
+_DESC_COLLATERAL_FMT = "담보율 {:.2f}%로 기준 미달".format
+_DESC_CONCENTRATION_FMT = "주수탁은행 집중도 {:.1f}%".format
+_DESC_LIQUIDITY_FMT = "준비금 대비 유통량 기준 유동성 비율 {:.1f}%".format
+
+
 # ====================================================
 # 1. 담보율 계산
 # ====================================================
@@ -44,43 +67,39 @@ def calculate_coverage(
     Returns:
         CoverageCheck: 담보 검증 결과
     """
-    circulation = on_chain.supply.net_circulation
-    reserves = off_chain.total_reserves
+    circulation = int(on_chain.supply.net_circulation)
+    reserves = int(off_chain.total_reserves)
 
-    # 담보율 계산
+    # 담보율 계산 — 정수 스케일(% × 10_000)
+    #  ratio_floor: 임계값 비교용 (버림 → 실제 비율 >= 임계값 과 동치)
+    #  ratio_e4   : 출력용 (소수 4자리 반올림)
     if circulation > 0:
-        coverage_ratio = reserves / circulation * 100
+        ratio_floor, rem = divmod(reserves * 100 * _RATIO_SCALE, circulation)
+        ratio_e4 = ratio_floor + (2 * rem >= circulation)
     else:
-        coverage_ratio = 0.0
+        ratio_floor = ratio_e4 = 0
 
+    coverage_ratio = ratio_e4 / _RATIO_SCALE
     excess_collateral = reserves - circulation
 
     # 상태 판정 → Verdict.status ("OK" | "WARNING" | "DEFICIT")
-    if coverage_ratio >= COVERAGE_OPTIMAL:
-        status = "OK"
-        message = f"담보율 {coverage_ratio:.2f}% - 정상 운영 중"
-    elif coverage_ratio >= COVERAGE_WARNING:
-        status = "WARNING"
-        message = f"담보율 {coverage_ratio:.2f}% - 주의 필요 (모니터링 강화 권장)"
-    elif coverage_ratio >= COVERAGE_CRITICAL:
-        status = "WARNING"
-        message = f"담보율 {coverage_ratio:.2f}% - 기준 근접, 추가 담보 확보 검토 필요"
-    else:
-        status = "DEFICIT"
-        message = f"담보율 {coverage_ratio:.2f}% - 긴급 조치 필요 (담보 부족)"
+    status, suffix = next(
+        (st, msg) for threshold, st, msg in _COVERAGE_STATUS_TABLE
+        if ratio_floor >= threshold
+    )
 
     verdict = Verdict(
         status=status,
-        message=message,
+        message=f"담보율 {coverage_ratio:.2f}% - {suffix}",
     )
 
     return CoverageCheck(
-        coverage_ratio=round(coverage_ratio, 4),
+        coverage_ratio=coverage_ratio,
         excess_collateral=excess_collateral,
         verdict=verdict,
         onchain_circulation=circulation,
         offchain_reserves=reserves,
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso(),
     )
 
 
@@ -91,15 +110,18 @@ def analyze_risk(
     on_chain: OnChainState,
     off_chain: OffChainReserves,
     coverage: CoverageCheck,
-) -> Tuple[str, List[RiskFactor]]:
+) -> Tuple[str, List[RiskFactor], int, Dict[str, float]]:
     """
     리스크 분석
 
     Returns:
-        Tuple[risk_level, risk_factors]
+        Tuple[risk_level, risk_factors, mask, metrics]
         risk_level: "LOW" | "MEDIUM" | "HIGH" | "CRITICAL"
+        mask: 발생한 리스크 카테고리의 RiskCategory 비트 OR
+        metrics: {"primary_share": ..., "liquidity_ratio": ...} (리포트에서 재사용)
     """
     risk_factors: List[RiskFactor] = []
+    mask = 0
 
     # 1) 담보 부족 리스크
     if coverage.coverage_ratio < COVERAGE_WARNING:
@@ -108,16 +130,15 @@ def analyze_risk(
             RiskFactor(
                 category="담보 부족",
                 severity=severity,
-                description=f"담보율 {coverage.coverage_ratio:.2f}%로 기준 미달",
+                description=_DESC_COLLATERAL_FMT(coverage.coverage_ratio),
             )
         )
+        mask |= RiskCategory.COLLATERAL
 
     # 2) 집중도 리스크 (주수탁 비중)
     total_reserves = off_chain.total_reserves
     if total_reserves > 0:
-        primary_total = sum(
-            c.balance for c in off_chain.institutions.primary_custodians
-        )
+        primary_total = off_chain.institutions.primary_balance_total
         primary_share = primary_total / total_reserves * 100
     else:
         primary_share = 0.0
@@ -127,9 +148,10 @@ def analyze_risk(
             RiskFactor(
                 category="집중도 리스크",
                 severity="MEDIUM",
-                description=f"주수탁은행 집중도 {primary_share:.1f}%",
+                description=_DESC_CONCENTRATION_FMT(primary_share),
             )
         )
+        mask |= RiskCategory.CONCENTRATION
 
     # 3) 유동성 리스크 (단순 비율: 준비금 / 유통량)
     if on_chain.supply.net_circulation > 0:
@@ -144,37 +166,44 @@ def analyze_risk(
             RiskFactor(
                 category="유동성 리스크",
                 severity="HIGH",
-                description=f"준비금 대비 유통량 기준 유동성 비율 {liquidity_ratio:.1f}%",
+                description=_DESC_LIQUIDITY_FMT(liquidity_ratio),
             )
         )
+        mask |= RiskCategory.LIQUIDITY
 
     # 4) coverage_ratio 기반 전체 리스크 레벨 결정
     cr = coverage.coverage_ratio
-    thresholds = RISK_LEVEL_THRESHOLDS  # {"LOW": ..., "MEDIUM": ..., "HIGH": ...}
-
-    if cr >= thresholds["LOW"]:
-        risk_level = "LOW"
-    elif cr >= thresholds["MEDIUM"]:
-        risk_level = "MEDIUM"
-    elif cr >= thresholds["HIGH"]:
-        risk_level = "HIGH"
-    else:
-        risk_level = "CRITICAL"
+    risk_level = next(level for threshold, level in RISK_BANDS if cr >= threshold)
+
+    metrics = {
+        "primary_share": primary_share,
+        "liquidity_ratio": liquidity_ratio,
+    }
+
+    return risk_level, risk_factors, mask, metrics
+
+
+# RISK_BANDS 를 오름차순 임계값 / 레벨로 분리 (bisect 용, CRITICAL 의 -inf 제외)
+_RISK_BAND_THRESHOLDS = tuple(t for t, _ in reversed(RISK_BANDS[:-1]))
+_RISK_BAND_LEVELS = tuple(level for _, level in reversed(RISK_BANDS))
+
 
-    return risk_level, risk_factors
+def analyze_risk_level_batch(coverage_ratios: Iterable[float]) -> List[str]:
+    """
+    담보율 여러 개를 한 번에 리스크 레벨로 분류 (what-if / 백테스트용).
+    analyze_risk 의 레벨 판정과 동일 기준 (coverage_ratio >= 임계값).
+    """
+    return [
+        _RISK_BAND_LEVELS[bisect_right(_RISK_BAND_THRESHOLDS, cr)]
+        for cr in coverage_ratios
+    ]
 
 
 # ====================================================
 # 3. 권고사항 생성
 # ====================================================
-def generate_recommendations(
-    risk_level: str,
-    risk_factors: List[RiskFactor],
-    coverage: CoverageCheck,
-) -> List[str]:
-    """
-    권고사항 생성
-    """
+def _compute_recommendations(risk_level: str, mask: int) -> List[str]:
+    """(risk_level, RiskCategory 비트) → 권고사항 목록"""
     recs: List[str] = []
 
     # 전반적인 리스크 레벨에 따른 기본 권고
@@ -183,11 +212,11 @@ def generate_recommendations(
         recs.append("신규 KRWS 발행 속도 조절 또는 일시 중단 검토")
 
     # 집중도 리스크가 있으면
-    if any(r.category == "집중도 리스크" for r in risk_factors):
+    if mask & RiskCategory.CONCENTRATION:
         recs.append("주수탁은행 외 보조수탁 및 기타 기관으로 자산 분산 검토")
 
     # 유동성 리스크가 있으면
-    if any(r.category == "유동성 리스크" for r in risk_factors):
+    if mask & RiskCategory.LIQUIDITY:
         recs.append("단기 국채·MMF 일부를 현금화하여 유동성 비율 개선")
 
     # 담보율에 따른 모니터링 강도
@@ -205,46 +234,61 @@ def generate_recommendations(
     return recs
 
 
+# 가능한 모든 (risk_level, mask) 조합의 권고사항을 import 시 미리 계산
+_REC_TABLE: Dict[Tuple[str, int], Tuple[str, ...]] = {
+    (level, mask): tuple(_compute_recommendations(level, mask))
+    for _, level in RISK_BANDS
+    for mask in range(1 << len(RiskCategory))
+}
+
+
+def generate_recommendations(
+    risk_level: str,
+    risk_factors: List[RiskFactor],
+    coverage: CoverageCheck,
+    mask: Optional[int] = None,
+) -> List[str]:
+    """
+    권고사항 생성
+
+    mask: analyze_risk 가 돌려준 RiskCategory 비트 (없으면 risk_factors 1회 순회로 계산)
+    """
+    if mask is None:
+        mask = 0
+        for r in risk_factors:
+            mask |= RISK_CATEGORY_FLAGS.get(r.category, 0)
+
+    recs = _REC_TABLE.get((risk_level, mask))
+    if recs is None:
+        return _compute_recommendations(risk_level, mask)
+    return list(recs)
+
+
 # ====================================================
 # 4. 리스크 리포트 생성
 # ====================================================
-def create_risk_report(
+def _build_report_parts(
     on_chain: OnChainState,
     off_chain: OffChainReserves,
     coverage: CoverageCheck,
-    format_type: str = "detailed",
-) -> RiskReport:
+    timestamp: Optional[str],
+):
     """
-    종합 리스크 리포트 생성
-
-    Args:
-        on_chain: 온체인 상태
-        off_chain: 오프체인 준비금
-        coverage: 담보 검증 결과
-        format_type: "summary" or "detailed" (현재 구조는 동일, 표현만 달리 사용 가능)
+    리포트 구성 요소 계산 (create_risk_report / create_risk_report_dict 공용)
 
     Returns:
-        RiskReport: 종합 리스크 리포트
+        Tuple[summary(dict), risk_factors, recommendations, timestamp]
     """
-    risk_level, risk_factors = analyze_risk(on_chain, off_chain, coverage)
-    recommendations = generate_recommendations(risk_level, risk_factors, coverage)
-
-    # 기관 집중도 계산
-    total_reserves = off_chain.total_reserves
-    if total_reserves > 0:
-        primary_total = sum(
-            c.balance for c in off_chain.institutions.primary_custodians
-        )
-        primary_share = primary_total / total_reserves * 100
-    else:
-        primary_share = 0.0
+    # 기관 집중도(primary_share)는 analyze_risk 에서 계산한 값을 그대로 사용
+    risk_level, risk_factors, mask, metrics = analyze_risk(on_chain, off_chain, coverage)
+    recommendations = generate_recommendations(risk_level, risk_factors, coverage, mask)
 
     key_metrics = {
         "coverage_ratio": coverage.coverage_ratio,
         "excess_collateral": coverage.excess_collateral,
         "onchain_circulation": coverage.onchain_circulation,
         "offchain_reserves": coverage.offchain_reserves,
-        "primary_share": primary_share,
+        "primary_share": metrics["primary_share"],
         "total_supply": on_chain.supply.total,
     }
 
@@ -255,19 +299,76 @@ def create_risk_report(
     else:
         overall_status = "CRITICAL"
 
-    summary = RiskSummary(
-        risk_level=risk_level,
-        overall_status=overall_status,
-        key_metrics=key_metrics,
-    )
+    summary = {
+        "risk_level": risk_level,
+        "overall_status": overall_status,
+        "key_metrics": key_metrics,
+    }
+
+    if timestamp is None:
+        timestamp = now_iso()
+
+    return summary, risk_factors, recommendations, timestamp
+
+
+def create_risk_report(
+    on_chain: OnChainState,
+    off_chain: OffChainReserves,
+    coverage: CoverageCheck,
+    format_type: str = "detailed",
+    timestamp: Optional[str] = None,
+) -> RiskReport:
+    """
+    종합 리스크 리포트 생성
+
+    Args:
+        on_chain: 온체인 상태
+        off_chain: 오프체인 준비금
+        coverage: 담보 검증 결과
+        format_type: "summary" or "detailed" (현재 구조는 동일, 표현만 달리 사용 가능)
+        timestamp: 리포트 시각 (없으면 현재 시각, coverage.timestamp 를 넘기면 동일 시각 공유)
 
-    timestamp = datetime.now().isoformat()
+    Returns:
+        RiskReport: 종합 리스크 리포트
+    """
+    summary, risk_factors, recommendations, timestamp = _build_report_parts(
+        on_chain, off_chain, coverage, timestamp
+    )
 
     # format_type이 "summary"여도 구조는 동일하게 두고,
     # 프론트에서 필요한 부분만 선택적으로 사용하면 된다.
     return RiskReport(
-        summary=summary,
+        summary=RiskSummary(**summary),
         risk_factors=risk_factors,
         recommendations=recommendations,
         timestamp=timestamp,
-    )
\ No newline at end of file
+    )
+
+
+def create_risk_report_dict(
+    on_chain: OnChainState,
+    off_chain: OffChainReserves,
+    coverage: CoverageCheck,
+    timestamp: Optional[str] = None,
+) -> Dict:
+    """
+    create_risk_report 와 같은 내용을 RiskReport 모델 없이 plain dict 로 반환.
+    (RiskReport.model_dump() 와 동일 구조, JSON 응답으로 바로 직렬화하는 경로용)
+    """
+    summary, risk_factors, recommendations, timestamp = _build_report_parts(
+        on_chain, off_chain, coverage, timestamp
+    )
+
+    return {
+        "summary": summary,
+        "risk_factors": [
+            {
+                "category": rf.category,
+                "severity": rf.severity,
+                "description": rf.description,
+            }
+            for rf in risk_factors
+        ],
+        "recommendations": recommendations,
+        "timestamp": timestamp,
+    }
@@ -0,0 +1,25 @@
+"""
+타임스탬프 헬퍼
+- 짧은 주기로 반복 호출되는 툴에서 datetime 생성 + 포맷 비용을 줄이기 위한 캐시
+"""
+
+import time
+from datetime import datetime
+
+# 같은 ISO 문자열을 재사용할 최대 간격 (초)
+TS_CACHE_TTL = 0.1
+
+# [생성 시각(time.time), ISO 문자열]
+_TS_CACHE = [0.0, ""]
+
+
+def now_iso() -> str:
+    """
+    현재 시각 ISO 문자열 (datetime.now().isoformat() 과 동일 형식).
+    TS_CACHE_TTL 이내 재호출 시 직전 문자열을 그대로 반환한다.
+    """
+    t = time.time()
+    if t - _TS_CACHE[0] > TS_CACHE_TTL:
+        _TS_CACHE[0] = t
+        _TS_CACHE[1] = datetime.fromtimestamp(t).isoformat()
+    return _TS_CACHE[1]
@@ -5,6 +5,8 @@
 - 리스크 레벨 기준
 """
 
+from core.types import Custodian, InstitutionGroup
+
 # 담보율 임계값
 COVERAGE_CRITICAL = 103.0  # 103% 미만: 위험
 COVERAGE_WARNING = 110.0  # 110% 미만: 주의
@@ -53,6 +55,24 @@ INSTITUTIONS = {
     }
 }
 
+# 금융기관 정보 → Custodian 템플릿 (import 시 1회 생성, 검증 생략)
+#  잔액/보관증권만 다른 Custodian 이 필요할 때 model_copy(update=...) 로 복제해서 사용
+#  부수탁 순서: 보조수탁은행 → 운용기관 → 보관기관
+INSTITUTION_MODELS = InstitutionGroup.model_construct(
+    primary_custodians=[
+        Custodian.model_construct(name=c["name"], code=c["code"], balance=0)
+        for c in INSTITUTIONS["primary_custodians"]
+    ],
+    secondary_custodians=[
+        Custodian.model_construct(name=c["name"], code=c["code"], balance=0)
+        for c in (
+            INSTITUTIONS["secondary_custodian"],
+            INSTITUTIONS["asset_manager"],
+            INSTITUTIONS["depository"],
+        )
+    ],
+)
+
 # 스테이블코인 정보
 STABLECOIN_INFO = {
     "name": "Korea Won Stablecoin",
@@ -67,4 +87,13 @@ RISK_LEVEL_THRESHOLDS = {
     "MEDIUM": 100.0,   # 100% ~ 105%
     "HIGH": 98.0,      # 98% ~ 100%
     "CRITICAL": 0.0    # 98% 미만
-}
\ No newline at end of file
+}
+
+# (하한 임계값, 리스크 레벨) — 임계값 내림차순, 첫 번째로 만족하는 구간 사용
+#  CRITICAL 은 나머지 전부이므로 -inf 로 둔다
+RISK_BANDS = (
+    (RISK_LEVEL_THRESHOLDS["LOW"], "LOW"),
+    (RISK_LEVEL_THRESHOLDS["MEDIUM"], "MEDIUM"),
+    (RISK_LEVEL_THRESHOLDS["HIGH"], "HIGH"),
+    (float("-inf"), "CRITICAL"),
+)
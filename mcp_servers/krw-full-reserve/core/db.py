@@ -1,43 +1,108 @@
+import asyncio
+import logging
 import os
 import asyncpg
-from typing import Optional
+from functools import cache
+from typing import Any, Dict, List, Optional, Tuple
+
+__all__ = ("get_pool", "ensure_history_index", "register_warm_query")
+
+logger = logging.getLogger(__name__)
 
 # 전역 커넥션 풀 (한 번만 만들고 재사용)
 _pool: Optional[asyncpg.Pool] = None
 
+# 동시 첫 호출 시 풀이 두 번 만들어지지 않도록 생성 구간을 잠근다
+_pool_lock = asyncio.Lock()
 
-async def get_pool() -> asyncpg.Pool:
+# 풀 튜닝: 병렬 tool 호출이 커넥션 대기에 막히지 않도록 + 반복 쿼리는 prepared statement 재사용
+# (Flask 워커 스레드들이 lock 없이 동시에 쿼리를 넣으므로 스레드 수 수준으로 잡는다)
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "20"))
+PG_STATEMENT_CACHE_SIZE = 256
+
+# 히스토리 조회(ORDER BY timestamp DESC + 기간 필터)용 MV 인덱스
+HISTORY_INDEX_DDL = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_frh_mv_ts
+    ON stablecoin.full_reserve_history_mv (timestamp DESC)
+"""
+
+
+# 새 커넥션마다 한 번 실행해 statement cache 에 올려둘 쿼리 (sql, args)
+#  asyncpg 의 Connection.prepare() 는 캐시를 거치지 않으므로, 결과 없는 인자(LIMIT 0 등)로
+#  실제 fetch 와 같은 경로를 한 번 태워 parse/plan 을 미리 끝내 둔다.
+_WARM_QUERIES: List[Tuple[str, tuple]] = []
+
+
+def register_warm_query(sql: str, *args: Any) -> None:
+    """풀 생성 전에 등록된 쿼리는 새 커넥션마다 미리 준비된다."""
+    _WARM_QUERIES.append((sql, args))
+
+
+async def _warm_statements(conn: asyncpg.Connection) -> None:
+    for sql, args in _WARM_QUERIES:
+        try:
+            await conn.fetch(sql, *args)
+        except Exception as e:
+            # 워밍 실패는 첫 실제 호출 때 다시 prepare 될 뿐이므로 커넥션 생성은 계속
+            logger.warning("⚠ statement 워밍 실패: %s", e)
+
+
+@cache
+def _pg_connect_kwargs() -> Dict[str, Any]:
     """
-    전역 asyncpg 풀. 처음 호출될 때 자동으로 초기화.
+    환경변수 → asyncpg.create_pool 접속 인자 (프로세스당 1회만 읽음).
 
     환경변수 우선순위:
       1) PG_DSN이 설정되어 있으면 그걸 그대로 사용
       2) 아니면 PG_HOST, PG_PORT, PG_DB, PG_USER, PG_PASSWORD 사용
     """
+    dsn = os.getenv("PG_DSN")
+    if dsn:
+        # DSN 문자열 전체 사용하는 경우
+        return {"dsn": dsn}
+
+    # 개별 값 사용
+    return {
+        "host": os.getenv("PG_HOST", "127.0.0.1"),
+        "port": int(os.getenv("PG_PORT", "5432")),
+        "database": os.getenv("PG_DB", "dancom_db"),
+        "user": os.getenv("PG_USER", "dancom"),
+        "password": os.getenv("PG_PASSWORD", "1q2w3e4r!"),
+    }
+
+
+async def get_pool() -> asyncpg.Pool:
+    """
+    전역 asyncpg 풀. 처음 호출될 때 자동으로 초기화.
+    (접속 정보는 _pg_connect_kwargs 참고)
+    """
     global _pool
 
     # 이미 풀 생성됨
     if _pool is not None:
         return _pool
 
-    dsn = os.getenv("PG_DSN")
-    if dsn:
-        # DSN 문자열 전체 사용하는 경우
-        _pool = await asyncpg.create_pool(
-            dsn=dsn,
-            min_size=1,
-            max_size=5,
-        )
-    else:
-        # 개별 값 사용
+    async with _pool_lock:
+        # 락 대기 중 다른 코루틴이 먼저 만들었으면 그대로 사용
+        if _pool is not None:
+            return _pool
+
         _pool = await asyncpg.create_pool(
-            host=os.getenv("PG_HOST", "127.0.0.1"),
-            port=int(os.getenv("PG_PORT", "5432")),
-            database=os.getenv("PG_DB", "dancom_db"),
-            user=os.getenv("PG_USER", "dancom"),
-            password=os.getenv("PG_PASSWORD", "1q2w3e4r!"),
+            **_pg_connect_kwargs(),
             min_size=1,
-            max_size=5,
+            max_size=PG_POOL_MAX,
+            statement_cache_size=PG_STATEMENT_CACHE_SIZE,
+            init=_warm_statements,
         )
 
     return _pool
+
+
+async def ensure_history_index() -> None:
+    """
+    full_reserve_history_mv 의 timestamp 인덱스를 보장한다.
+    (CONCURRENTLY 는 트랜잭션 밖에서만 가능 → 단독 execute)
+    """
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(HISTORY_INDEX_DDL)
@@ -0,0 +1,49 @@
+"""
+Flask JSON 직렬화 헬퍼
+- 표준 json 모듈(순수 Python 인코더) 대신 pydantic-core(Rust) 직렬화기 사용
+- 히스토리 응답(최대 수천 행)처럼 큰 payload 의 CPU 비용을 줄이기 위함
+- orjson 대신 pydantic-core 를 쓰는 이유: 툴 결과 중 pydantic 모델은 model_dump_json() 으로
+  중간 dict 없이 바로 직렬화되고, datetime / Decimal / Enum 도 같은 규칙으로 처리된다
+  (pydantic 과 함께 설치되므로 별도 의존성도 늘지 않음)
+"""
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+
+def dumps_text(obj: Any) -> str:
+    """
+    툴 결과 → JSON 문자열.
+    pydantic 모델은 model_dump_json() 으로 중간 dict 없이 바로 str 을 만들고,
+    그 외(dict 등)는 datetime / Decimal 포함 to_json 으로 직렬화한다.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json()
+    return to_json(obj).decode()
+
+
+def json_response(body: Any, status: int = 200) -> Response:
+    """
+    JSON-RPC 응답 본문 → Response.
+    jsonify(provider → str → 다시 bytes 인코딩)를 거치지 않고 to_json 의 bytes 를 그대로 싣는다.
+    """
+    return Response(to_json(body, serialize_unknown=True), status=status, mimetype="application/json")
+
+
+class PydanticJSONProvider(JSONProvider):
+    """app.json 에 연결해서 jsonify / request.get_json 을 pydantic-core 로 처리."""
+
+    # debug 모드에서도 들여쓰기 / 키 정렬 없이 compact 출력
+    # (Flask 2.3+ 에서는 JSON_SORT_KEYS / JSONIFY_PRETTYPRINT_REGULAR 대신 provider 속성)
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return to_json(obj, serialize_unknown=True).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return from_json(s)
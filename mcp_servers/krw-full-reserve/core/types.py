@@ -3,10 +3,12 @@ KRWS Core Type Definitions - Final Stable Version
 온체인/오프체인/커버리지/리포트 모든 툴이 100% 동작하도록 통합한 타입 정의
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Literal, Optional
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
+from typing import Annotated, List, Literal, Optional
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntFlag
+from functools import cached_property
+from operator import attrgetter
 
 
 # ============================================
@@ -18,7 +20,15 @@ class APIError(Exception):
     pass
 
 
-class CreditRating(str, Enum):
+try:
+    from enum import StrEnum  # Python 3.11+
+except ImportError:  # Python 3.10
+    class StrEnum(str, Enum):
+        def __str__(self) -> str:
+            return self.value
+
+
+class CreditRating(StrEnum):
     AAA = "AAA"
     AA_PLUS = "AA+"
     AA = "AA"
@@ -32,6 +42,27 @@ class CreditRating(str, Enum):
     NR = "NR"
 
 
+# ============================================
+# 공통 필드 타입 — 숫자 입력은 음수를 0 으로 보정
+#  (모델별 fix_* validator 대신 스키마 빌드 시 1회 구성되는 공용 validator)
+# ============================================
+
+def _clamp_non_neg_int(v):
+    if isinstance(v, (int, float)):
+        return max(0, int(v))
+    return v
+
+
+def _clamp_non_neg_float(v):
+    if isinstance(v, (int, float)):
+        return max(0.0, float(v))
+    return v
+
+
+NonNegInt = Annotated[int, BeforeValidator(_clamp_non_neg_int)]
+NonNegFloat = Annotated[float, BeforeValidator(_clamp_non_neg_float)]
+
+
 # ============================================
 # Security
 # ============================================
@@ -40,17 +71,10 @@ class Security(BaseModel):
     custodian_name: str
     custodian_code: str
     security_type: str
-    market_value: int
-    book_value: int
+    market_value: NonNegInt
+    book_value: NonNegInt
     verification_date: str
 
-    @field_validator("market_value", "book_value", mode="before")
-    @classmethod
-    def fix_values(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
-
 
 # ============================================
 # Custodian
@@ -60,18 +84,11 @@ class Custodian(BaseModel):
     id: Optional[str] = None       # 내부 식별자
     name: str
     code: Optional[str] = None
-    balance: int
+    balance: NonNegInt
     credit_rating: Optional[CreditRating] = None
     risk_weight: Optional[float] = None
     securities: List[Security] = Field(default_factory=list)
 
-    @field_validator("balance", mode="before")
-    @classmethod
-    def fix_balance(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
-
 
 # ============================================
 # InstitutionGroup (기관 그룹)
@@ -81,6 +98,11 @@ class InstitutionGroup(BaseModel):
     primary_custodians: List[Custodian]
     secondary_custodians: List[Custodian]
 
+    @cached_property
+    def primary_balance_total(self) -> int:
+        """주수탁은행 잔액 합계 (인스턴스당 1회 계산 후 재사용)"""
+        return sum(map(attrgetter("balance"), self.primary_custodians))
+
 
 # ============================================
 # On-Chain: Supply
@@ -90,24 +112,15 @@ class Supply(BaseModel):
     """
     공급량 모델 (구 TokenSupply와 완전 호환)
     """
-    total: int = Field(..., ge=0)
+    total: NonNegInt = Field(..., ge=0)
 
     # 신규 필드
-    burned: int = 0
-    net_circulation: int = 0
+    burned: NonNegInt = 0
+    net_circulation: NonNegInt = 0
 
     # 구버전 필드 (옵션)
-    circulating: Optional[int] = None
-    locked: Optional[int] = None
-
-    @field_validator("total", "burned", "net_circulation", "circulating", "locked", mode="before")
-    @classmethod
-    def fix_int_fields(cls, v):
-        if v is None:
-            return v
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
+    circulating: Optional[NonNegInt] = None
+    locked: Optional[NonNegInt] = None
 
 
 # TokenSupply 이름을 사용하는 옛 코드 호환용
@@ -119,17 +132,10 @@ TokenSupply = Supply
 # ============================================
 
 class BlockInfo(BaseModel):
-    number: int
+    number: NonNegInt
     timestamp: str
     hash: Optional[str] = None
 
-    @field_validator("number", mode="before")
-    @classmethod
-    def fix_block_number(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
-
     @field_validator("timestamp", mode="before")
     @classmethod
     def fix_timestamp(cls, v):
@@ -153,17 +159,10 @@ class OnChainState(BaseModel):
 # ============================================
 
 class OffChainReserves(BaseModel):
-    total_reserves: int
+    total_reserves: NonNegInt
     institutions: InstitutionGroup
     timestamp: str
 
-    @field_validator("total_reserves", mode="before")
-    @classmethod
-    def fix_reserves(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
-
     @field_validator("timestamp", mode="before")
     @classmethod
     def fix_timestamp(cls, v):
@@ -182,27 +181,13 @@ class Verdict(BaseModel):
 
 
 class CoverageCheck(BaseModel):
-    coverage_ratio: float
+    coverage_ratio: NonNegFloat
     excess_collateral: int
     verdict: Verdict
-    onchain_circulation: int
-    offchain_reserves: int
+    onchain_circulation: NonNegInt
+    offchain_reserves: NonNegInt
     timestamp: str
 
-    @field_validator("coverage_ratio", mode="before")
-    @classmethod
-    def fix_ratio(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0.0, float(v))
-        return v
-
-    @field_validator("onchain_circulation", "offchain_reserves", mode="before")
-    @classmethod
-    def fix_numbers(cls, v):
-        if isinstance(v, (int, float)):
-            return max(0, int(v))
-        return v
-
     @field_validator("timestamp", mode="before")
     @classmethod
     def fix_timestamp(cls, v):
@@ -215,6 +200,21 @@ class CoverageCheck(BaseModel):
 # Risk Report
 # ============================================
 
+class RiskCategory(IntFlag):
+    """RiskFactor.category 비트 플래그 (카테고리 존재 여부를 비트 연산으로 판정)"""
+    COLLATERAL = 1       # 담보 부족
+    CONCENTRATION = 2    # 집중도 리스크
+    LIQUIDITY = 4        # 유동성 리스크
+
+
+# RiskFactor.category 문자열 → RiskCategory
+RISK_CATEGORY_FLAGS = {
+    "담보 부족": RiskCategory.COLLATERAL,
+    "집중도 리스크": RiskCategory.CONCENTRATION,
+    "유동성 리스크": RiskCategory.LIQUIDITY,
+}
+
+
 class RiskFactor(BaseModel):
     category: str
     severity: Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]
@@ -3,18 +3,42 @@ Mock Data Generator - Fixed Version
 음수 market_value 버그 수정
 """
 
+import os
 import random
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
+from core.constants import INSTITUTION_MODELS
 from core.types import (
     OnChainState, 
     OffChainReserves, 
     Supply,
+    BlockInfo,
     Institutions,
     Custodian,
     Security
 )
 
+# 1 이면 검증 경로(모델 생성자)로 생성 — 디버그용
+# 기본은 model_construct 로 validator 생략 (값은 여기서 이미 음수 없는 int 로 보장)
+MOCK_VALIDATE = os.getenv("KRWS_MOCK_VALIDATE", "").lower() in ("1", "true", "yes")
+
+
+def _build(model, **fields):
+    """Mock 모델 생성 (기본: 검증 생략, MOCK_VALIDATE 시 전체 검증)"""
+    if MOCK_VALIDATE:
+        return model(**fields)
+    return model.model_construct(**fields)
+
+
+# 증권 구성 비율 추출 범위 (예금, 국채, 국채 장부가 조정, 회사채 장부가 조정)
+_SECURITY_RATIO_RANGES = (
+    (0.60, 0.70),
+    (0.20, 0.30),
+    (0.98, 1.02),
+    (0.95, 1.05),
+)
+
 
 class MockDataGenerator:
     """
@@ -22,17 +46,28 @@ class MockDataGenerator:
     매번 호출 시 다른 값 반환 (시간에 따라 변화)
     """
     
-    # 금융기관 목록
-    PRIMARY_CUSTODIANS = [
-        {"name": "신한은행", "code": "SH", "type": "primary"},
-        {"name": "KB국민은행", "code": "KB", "type": "primary"},
-    ]
+    # 금융기관 목록 (core.constants 의 Custodian 템플릿 재사용)
+    PRIMARY_CUSTODIANS = INSTITUTION_MODELS.primary_custodians
+    SECONDARY_CUSTODIANS = INSTITUTION_MODELS.secondary_custodians
     
-    SECONDARY_CUSTODIANS = [
-        {"name": "KDB산업은행", "code": "KDB", "type": "secondary"},
-        {"name": "NH투자증권", "code": "NH", "type": "secondary"},
-        {"name": "한국예탁결제원", "code": "KSD", "type": "secondary"},
-    ]
+    # 시나리오별 기본 잔액 (주수탁은행, 부수탁은행) — 위 기관 목록 순서
+    BASE_BALANCES = {
+        # 담보 부족 시나리오
+        "critical": (
+            (3_000_000_000, 2_500_000_000),
+            (1_500_000_000, 1_000_000_000, 500_000_000),
+        ),
+        # 경고 시나리오
+        "warning": (
+            (4_000_000_000, 3_500_000_000),
+            (2_000_000_000, 1_500_000_000, 1_000_000_000),
+        ),
+        # 정상 시나리오 (충분한 담보)
+        "normal": (
+            (4_500_000_000, 4_000_000_000),
+            (2_500_000_000, 2_000_000_000, 1_500_000_000),
+        ),
+    }
     
     def __init__(self, scenario: str = "normal"):
         """
@@ -40,6 +75,9 @@ class MockDataGenerator:
             scenario: "normal", "warning", "critical"
         """
         self.scenario = scenario
+        self._primary_base, self._secondary_base = self.BASE_BALANCES.get(
+            scenario, self.BASE_BALANCES["normal"]
+        )
     
     def generate_onchain_state(self) -> OnChainState:
         """
@@ -64,15 +102,20 @@ class MockDataGenerator:
         burned = max(0, base_burned + random.randint(-50_000_000, 50_000_000))
         net_circulation = max(0, total_supply - burned)
         
-        return OnChainState(
-            supply=Supply(
+        return _build(
+            OnChainState,
+            supply=_build(
+                Supply,
                 total=total_supply,
                 burned=burned,
                 net_circulation=net_circulation
             ),
             contract_address="0x1234567890abcdef1234567890abcdef12345678",
-            block_number=random.randint(18_000_000, 18_100_000),
-            timestamp=datetime.now().isoformat()
+            block=_build(
+                BlockInfo,
+                number=random.randint(18_000_000, 18_100_000),
+                timestamp=datetime.now().isoformat()
+            ),
         )
     
     def generate_offchain_reserves(self) -> OffChainReserves:
@@ -82,74 +125,56 @@ class MockDataGenerator:
         Returns:
             OffChainReserves: 금융기관 담보 데이터
         """
-        # 시나리오별 기본 배분 비율
-        if self.scenario == "critical":
-            # 담보 부족 시나리오
-            primary_base = [3_000_000_000, 2_500_000_000]
-            secondary_base = [1_500_000_000, 1_000_000_000, 500_000_000]
-        elif self.scenario == "warning":
-            # 경고 시나리오
-            primary_base = [4_000_000_000, 3_500_000_000]
-            secondary_base = [2_000_000_000, 1_500_000_000, 1_000_000_000]
-        else:  # normal
-            # 정상 시나리오 (충분한 담보)
-            primary_base = [4_500_000_000, 4_000_000_000]
-            secondary_base = [2_500_000_000, 2_000_000_000, 1_500_000_000]
-        
-        # 주수탁은행 생성
-        primary_custodians = []
-        for i, custodian_info in enumerate(self.PRIMARY_CUSTODIANS):
-            base = primary_base[i]
-            
-            # ✅ 실시간 변동 (항상 양수 보장)
-            balance = max(0, base + random.randint(-200_000_000, 200_000_000))
-            
-            securities = self._generate_securities(
-                custodian_info["name"],
-                custodian_info["code"],
-                balance
-            )
-            
-            primary_custodians.append(Custodian(
-                name=custodian_info["name"],
-                code=custodian_info["code"],
-                balance=balance,
-                securities=securities
-            ))
-        
-        # 부수탁은행 생성
-        secondary_custodians = []
-        for i, custodian_info in enumerate(self.SECONDARY_CUSTODIANS):
-            base = secondary_base[i]
-            
-            # ✅ 실시간 변동 (항상 양수 보장)
-            balance = max(0, base + random.randint(-100_000_000, 100_000_000))
-            
-            securities = self._generate_securities(
-                custodian_info["name"],
-                custodian_info["code"],
-                balance
-            )
-            
-            secondary_custodians.append(Custodian(
-                name=custodian_info["name"],
-                code=custodian_info["code"],
-                balance=balance,
-                securities=securities
-            ))
+        # ✅ 기관별 실시간 변동을 그룹 단위로 한 번에 생성 (항상 양수 보장)
+        primary_balances = self._jitter_balances(self._primary_base, 200_000_000)
+        secondary_balances = self._jitter_balances(self._secondary_base, 100_000_000)
+
+        # 주수탁은행 / 부수탁은행 생성
+        primary_custodians = self._build_custodians(self.PRIMARY_CUSTODIANS, primary_balances)
+        secondary_custodians = self._build_custodians(self.SECONDARY_CUSTODIANS, secondary_balances)
         
         # 총 준비금 계산
-        total_reserves = sum(c.balance for c in primary_custodians + secondary_custodians)
+        total_reserves = sum(primary_balances) + sum(secondary_balances)
         
-        return OffChainReserves(
+        return _build(
+            OffChainReserves,
             total_reserves=total_reserves,
-            institutions=Institutions(
+            institutions=_build(
+                Institutions,
                 primary_custodians=primary_custodians,
                 secondary_custodians=secondary_custodians
             ),
             timestamp=datetime.now().isoformat()
         )
     
+    @staticmethod
+    def _jitter_balances(bases, spread: int) -> list[int]:
+        """기본 잔액 각각에 ±spread 변동을 더한 잔액 목록 (음수는 0)"""
+        randint = random.randint
+        return [max(0, base + randint(-spread, spread)) for base in bases]
+
+    def _build_custodians(self, templates, balances) -> list[Custodian]:
+        """Custodian 템플릿 + 잔액 → Custodian 목록 (보관 증권 포함)"""
+        if MOCK_VALIDATE:
+            return [
+                Custodian(
+                    name=t.name,
+                    code=t.code,
+                    balance=balance,
+                    securities=self._generate_securities(t.name, t.code, balance)
+                )
+                for t, balance in zip(templates, balances)
+            ]
+
+        # 템플릿 얕은 복사 + 잔액/증권만 교체
+        return [
+            t.model_copy(update={
+                "balance": balance,
+                "securities": self._generate_securities(t.name, t.code, balance),
+            })
+            for t, balance in zip(templates, balances)
+        ]
+
     def _generate_securities(
         self, 
         custodian_name: str, 
@@ -167,55 +192,48 @@ class MockDataGenerator:
         Returns:
             list[Security]: 증권 리스트
         """
-        securities = []
-        
-        # 예금 (60-70%)
-        deposit_ratio = random.uniform(0.60, 0.70)
-        deposit_value = max(0, int(total_balance * deposit_ratio))
-        
-        securities.append(Security(
-            custodian_name=custodian_name,
-            custodian_code=custodian_code,
-            security_type="deposit",
-            market_value=deposit_value,
-            book_value=deposit_value,  # 예금은 시가=장부가
-            verification_date=datetime.now().isoformat()
-        ))
-        
-        # 국채 (20-30%)
-        treasury_ratio = random.uniform(0.20, 0.30)
-        treasury_market = max(0, int(total_balance * treasury_ratio))
-        # ✅ 국채는 시가와 장부가가 약간 다를 수 있음 (항상 양수)
-        treasury_book = max(0, int(treasury_market * random.uniform(0.98, 1.02)))
-        
-        securities.append(Security(
-            custodian_name=custodian_name,
-            custodian_code=custodian_code,
-            security_type="treasury_bond",
-            market_value=treasury_market,
-            book_value=treasury_book,
-            verification_date=datetime.now().isoformat()
-        ))
-        
-        # 회사채 (5-15%)
-        remaining = max(0, total_balance - deposit_value - treasury_market)
-        corporate_market = remaining
-        # ✅ 회사채는 변동성이 더 큼 (항상 양수)
-        corporate_book = max(0, int(corporate_market * random.uniform(0.95, 1.05)))
-        
-        securities.append(Security(
-            custodian_name=custodian_name,
-            custodian_code=custodian_code,
-            security_type="corporate_bond",
-            market_value=corporate_market,
-            book_value=corporate_book,
-            verification_date=datetime.now().isoformat()
-        ))
-        
-        return securities
+        # 비율 4개를 한 번에 추출 (예금 / 국채 / 국채 장부가 조정 / 회사채 장부가 조정)
+        uniform = random.uniform
+        deposit_ratio, treasury_ratio, treasury_adj, corporate_adj = [
+            uniform(lo, hi) for lo, hi in _SECURITY_RATIO_RANGES
+        ]
+        verification_date = datetime.now().isoformat()
+
+        # total_balance >= 0, 비율 > 0 → 곱 결과도 항상 0 이상
+        # 예금 (60-70%) — 시가=장부가
+        deposit_value = int(total_balance * deposit_ratio)
+        # 국채 (20-30%) — 시가와 장부가가 약간 다를 수 있음
+        treasury_market = int(total_balance * treasury_ratio)
+        treasury_book = int(treasury_market * treasury_adj)
+        # 회사채 (나머지) — 변동성이 더 큼
+        corporate_market = max(0, total_balance - deposit_value - treasury_market)
+        corporate_book = int(corporate_market * corporate_adj)
+
+        return [
+            _build(
+                Security,
+                custodian_name=custodian_name,
+                custodian_code=custodian_code,
+                security_type=security_type,
+                market_value=market_value,
+                book_value=book_value,
+                verification_date=verification_date
+            )
+            for security_type, market_value, book_value in (
+                ("deposit", deposit_value, deposit_value),
+                ("treasury_bond", treasury_market, treasury_book),
+                ("corporate_bond", corporate_market, corporate_book),
+            )
+        ]
     
+@lru_cache(maxsize=4)
+def _get_generator(scenario: str) -> MockDataGenerator:
+    """시나리오별 MockDataGenerator 1개를 재사용 (상태는 scenario 뿐)"""
+    return MockDataGenerator(scenario=scenario)
+
+
 def get_mock_data(scenario: Literal["normal", "warning", "critical"] = "normal"):
-      generator = MockDataGenerator(scenario=scenario)
+      generator = _get_generator(scenario)
       onchain = generator.generate_onchain_state()
       offchain = generator.generate_offchain_reserves()
       return {
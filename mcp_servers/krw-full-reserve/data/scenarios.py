@@ -5,6 +5,8 @@
 - SCENARIO_CRITICAL: 담보율 97% (위험)
 """
 
+from types import MappingProxyType
+
 # 시나리오 A: 정상 운영 (담보율 105%)
 SCENARIO_NORMAL = {
     "name": "정상 운영",
@@ -149,9 +151,42 @@ SCENARIO_CRITICAL = {
     }
 }
 
-# 시나리오 매핑
-SCENARIOS = {
-    "normal": SCENARIO_NORMAL,
-    "warning": SCENARIO_WARNING,
-    "critical": SCENARIO_CRITICAL,
-}
\ No newline at end of file
+# ─────────────────────────────────────────────
+# 시나리오별 집계값 (정적 데이터이므로 import 시 1회 계산)
+#  - 툴 호출마다 custodian / securities 리스트를 다시 순회하지 않도록
+#  - 소비 측은 SCENARIO_TOTALS[scenario]["..."] 로 바로 읽는다
+# ─────────────────────────────────────────────
+def _scenario_totals(scenario: dict) -> MappingProxyType:
+    off_chain = scenario["off_chain"]
+    total_supply = scenario["on_chain"]["total_supply"]
+    circulating = scenario["on_chain"]["circulating"]
+    total_reserves = off_chain["total_reserves"]
+    return MappingProxyType({
+        "primary_sum": sum(c["balance"] for c in off_chain["primary_custodians"]),
+        "secondary_sum": off_chain["secondary_custodian"]["balance"],
+        "asset_manager_sum": sum(off_chain["asset_manager"]["portfolio"].values()),
+        "securities_sum": sum(s["market_value"] for s in off_chain["depository"]["securities"]),
+        "total_reserves": total_reserves,
+        "total_supply": total_supply,
+        "circulating": circulating,
+        "coverage_ratio": round(total_reserves / total_supply * 100, 2),
+        "circulating_coverage_ratio": round(total_reserves / circulating * 100, 2),
+    })
+
+
+SCENARIO_NORMAL_TOTALS = _scenario_totals(SCENARIO_NORMAL)
+SCENARIO_WARNING_TOTALS = _scenario_totals(SCENARIO_WARNING)
+SCENARIO_CRITICAL_TOTALS = _scenario_totals(SCENARIO_CRITICAL)
+
+# 시나리오 매핑 (읽기 전용 — 공용 참조 데이터가 실수로 변경되지 않도록)
+SCENARIOS = MappingProxyType({
+    "normal": MappingProxyType(SCENARIO_NORMAL),
+    "warning": MappingProxyType(SCENARIO_WARNING),
+    "critical": MappingProxyType(SCENARIO_CRITICAL),
+})
+
+SCENARIO_TOTALS = MappingProxyType({
+    "normal": SCENARIO_NORMAL_TOTALS,
+    "warning": SCENARIO_WARNING_TOTALS,
+    "critical": SCENARIO_CRITICAL_TOTALS,
+})
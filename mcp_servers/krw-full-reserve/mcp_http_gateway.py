@@ -5,19 +5,17 @@ KRW Full Reserve MCP HTTP Gateway
 
 from __future__ import annotations
 
-import asyncio
-import json
-import traceback
-import threading
-from typing import Dict, Any
+import logging
+import os
+from itertools import chain
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import ormsgpack
+from pydantic_core import to_json, to_jsonable_python
 
-# ─────────────────────────────────────────────
-# 글로벌 이벤트 루프 생성 + 백그라운드 스레드에서 실행
-# ─────────────────────────────────────────────
-loop = asyncio.new_event_loop()
-threading.Thread(target=loop.run_forever, daemon=True).start()
+# 글로벌 이벤트 루프 (백그라운드 스레드) — asyncpg 풀을 요청 간 재사용
+from core.async_runner import iter_async, run_async as _run_async
 
 
 # ─────────────────────────────────────────────
@@ -26,36 +24,143 @@ threading.Thread(target=loop.run_forever, daemon=True).start()
 from app_mcp.tools.onchain import get_onchain_state
 from app_mcp.tools.offchain import get_offchain_reserves
 from app_mcp.tools.coverage import check_coverage
-from app_mcp.tools.report import get_risk_report
-from app_mcp.tools.history import get_full_reserve_history
+from app_mcp.tools.report import get_risk_report_dict
+from app_mcp.tools.history import (
+    cache_get,
+    cache_put,
+    get_full_reserve_history,
+    history_cache_key,
+    iter_full_reserve_history,
+)
+from core.db import ensure_history_index
+from core.json_provider import PydanticJSONProvider, dumps_text, json_response
+
+logger = logging.getLogger(__name__)
+
+# MCP_DEBUG=1 이면 요청/응답 디버그 로그 출력 (기본은 INFO — 요청마다 포맷팅하지 않음)
+MCP_DEBUG = os.getenv("MCP_DEBUG", "").lower() in ("1", "true", "yes")
+# waitress 요청 처리 스레드 수 (asyncpg 풀 크기 PG_POOL_MAX 이하로 유지)
+MCP_THREADS = int(os.getenv("MCP_THREADS", "16"))
 
 
 # Flask 앱
 app = Flask(__name__)
+app.json = PydanticJSONProvider(app)
+
+def _drop_format(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    # get_risk_report 는 format 인자를 받지 않으므로 제거
+    arguments.pop("format", None)
+    return arguments
 
-# MCP 툴 매핑
-TOOLS: Dict[str, Any] = {
-    "get_onchain_state": get_onchain_state,
-    "get_offchain_reserves": get_offchain_reserves,
-    "check_coverage": check_coverage,
-    "get_risk_report": get_risk_report,
-    "get_full_reserve_history": get_full_reserve_history,
+
+# MCP 툴 매핑: tool name → (함수, 인자 전처리 or None)
+#  툴별 인자 보정은 여기서만 등록 → mcp_call 은 툴 이름으로 분기하지 않는다
+TOOLS: Dict[str, Tuple[Callable[..., Any], Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]]] = {
+    "get_onchain_state": (get_onchain_state, None),
+    "get_offchain_reserves": (get_offchain_reserves, None),
+    "check_coverage": (check_coverage, None),
+    # 응답을 바로 직렬화하므로 모델 생성 없는 dict 경로 사용
+    "get_risk_report": (get_risk_report_dict, _drop_format),
+    "get_full_reserve_history": (get_full_reserve_history, None),
 }
 
 
 # ─────────────────────────────────────────────
-# async 함수 실행 안전 헬퍼
+# MessagePack 응답 (Accept: application/msgpack)
+#  - 숫자 위주의 큰 결과(히스토리 points)를 JSON 텍스트 대신 바이너리로 전송
+#  - 결과는 JSON 문자열로 감싸지 않고 content[0].data 에 객체 그대로 넣는다
 # ─────────────────────────────────────────────
-def _run_async(func, **kwargs):
-    """
-    모든 async 함수는 글로벌 event loop 에서 thread-safe 로 실행한다.
-    """
-    if asyncio.iscoroutinefunction(func):
-        coro = func(**kwargs)
-        future = asyncio.run_coroutine_threadsafe(coro, loop)
-        return future.result()
-    else:
-        return func(**kwargs)
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+def _wants_msgpack() -> bool:
+    best = request.accept_mimetypes.best_match(["application/json", MSGPACK_MIMETYPE])
+    return best == MSGPACK_MIMETYPE
+
+
+def _msgpack_response(rpc_id, result) -> Response:
+    body = {
+        "jsonrpc": "2.0",
+        "id": rpc_id,
+        "result": {
+            "content": [
+                {
+                    "type": "msgpack",
+                    # pydantic 모델 / datetime 등은 msgpack 기본 타입으로 변환
+                    "data": to_jsonable_python(result),
+                }
+            ]
+        },
+    }
+    return Response(ormsgpack.packb(body), mimetype=MSGPACK_MIMETYPE)
+
+
+# ─────────────────────────────────────────────
+# 히스토리 스트리밍 응답
+#  - 최대 수천 행이라 전체 dict 리스트 + 응답 문자열을 메모리에 만들지 않고
+#    서버 사이드 커서 chunk 단위로 바로 내보낸다.
+#  - content[0].text 는 "JSON 문자열 안의 JSON" 이므로 조각마다 문자열 escape 후 전송
+#    (count 는 끝까지 읽어야 알 수 있으므로 points 뒤에 위치)
+# ─────────────────────────────────────────────
+def _escape(text: str) -> str:
+    """JSON 문자열 리터럴 내부용 escape (앞뒤 따옴표 제외)."""
+    return to_json(text).decode()[1:-1]
+
+
+# 인자 키 → escape 된 content text (직렬화 결과 자체를 캐시 → 히트 시 DB + 재직렬화 생략)
+_HISTORY_TEXT_CACHE: Dict[tuple, Any] = {}
+
+_ENVELOPE_TAIL = '"}]}}'
+
+
+def _envelope_head(rpc_id) -> str:
+    return (
+        f'{{"jsonrpc":"2.0","id":{dumps_text(rpc_id)},'
+        f'"result":{{"content":[{{"type":"json","text":"'
+    )
+
+
+def _stream_history(rpc_id, arguments: Dict[str, Any]) -> Response:
+    key = history_cache_key(**arguments)
+    cached = cache_get(_HISTORY_TEXT_CACHE, key)
+    if cached is not None:
+        return Response(_envelope_head(rpc_id) + cached + _ENVELOPE_TAIL, mimetype="application/json")
+
+    chunks = iter_async(iter_full_reserve_history(**arguments))
+    # 첫 chunk 는 응답 시작 전에 읽는다 → DB 연결/쿼리 에러는 일반 에러 응답으로 처리됨
+    first = next(chunks, [])
+
+    header = dumps_text({
+        "metric": key[0],
+        "from": key[1],
+        "to": key[2],
+    })[:-1] + ',"points":['
+
+    def generate():
+        yield _envelope_head(rpc_id)
+        parts = [_escape(header)]
+        yield parts[0]
+        count = 0
+        sep = ""
+        for points in chain((first,), chunks):
+            if not points:
+                continue
+            count += len(points)
+            parts.append(_escape(sep + dumps_text(points)[1:-1]))
+            yield parts[-1]
+            sep = ","
+        parts.append(_escape(f'],"count":{count}}}'))
+        # 끝까지 전송된 응답만 캐시
+        cache_put(_HISTORY_TEXT_CACHE, key, "".join(parts))
+        yield parts[-1] + _ENVELOPE_TAIL
+
+    return Response(generate(), mimetype="application/json")
+
+
+# JSON 응답을 스트리밍으로 내보내는 툴: tool name → (rpc_id, arguments) → Response
+STREAM_TOOLS = {
+    "get_full_reserve_history": _stream_history,
+}
 
 
 # ─────────────────────────────────────────────
@@ -65,11 +170,12 @@ def _run_async(func, **kwargs):
 def mcp_call():
     try:
         payload = request.get_json(silent=True) or {}
-        print(f"🛰 KRW HTTP MCP 수신 payload: {payload}")
 
         method = payload.get("method")
         rpc_id = payload.get("id")
         params = payload.get("params") or {}
+        # 요청 본문 전체 repr 대신 method / tool 이름만 기록
+        logger.debug("🛰 KRW HTTP MCP 수신: method=%s tool=%s", method, params.get("name"))
 
         if method != "tools/call":
             return jsonify({
@@ -94,35 +200,38 @@ def mcp_call():
                 }
             }), 400
 
-        func = TOOLS[tool_name]
+        func, prepare = TOOLS[tool_name]
+        if prepare is not None:
+            arguments = prepare(arguments)
 
-        print(f"🔧 KRW MCP 호출: {tool_name}({arguments})")
+        logger.debug("🔧 KRW MCP 호출: %s(%s)", tool_name, arguments)
 
-        if tool_name == "get_risk_report" and "format" in arguments:
-            arguments.pop("format", None)
+        if _wants_msgpack():
+            return _msgpack_response(rpc_id, _run_async(func, **arguments))
+
+        stream = STREAM_TOOLS.get(tool_name)
+        if stream is not None:
+            return stream(rpc_id, arguments)
 
         # async 서브루틴 실행
         result = _run_async(func, **arguments)
 
-        return jsonify({
+        return json_response({
             "jsonrpc": "2.0",
             "id": rpc_id,
             "result": {
                 "content": [
                     {
                         "type": "json",
-                        "text": json.dumps(
-                            result.model_dump() if hasattr(result, "model_dump") else result,
-                            ensure_ascii=False
-                        )
+                        # pydantic 모델 / dict 모두 pydantic-core 로 바로 직렬화
+                        "text": dumps_text(result),
                     }
                 ]
             }
         })
 
     except Exception as e:
-        print("❌ KRW MCP HTTP Gateway 에러:", e)
-        traceback.print_exc()
+        logger.exception("❌ KRW MCP HTTP Gateway 에러: %s", e)
         return jsonify({
             "jsonrpc": "2.0",
             "id": rpc_id,
@@ -148,9 +257,27 @@ def health():
 # 서버 시작
 # ─────────────────────────────────────────────
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if MCP_DEBUG else logging.INFO)
+
     print("=" * 60)
     print("🚀 KRW Full Reserve MCP HTTP Gateway 시작")
     print("   - URL: http://0.0.0.0:5400/mcp")
     print("   - Tools:", ", ".join(TOOLS.keys()))
     print("=" * 60)
-    app.run(host="0.0.0.0", port=5400, debug=True)
+
+    # 히스토리 MV timestamp 인덱스 보장 (실패해도 게이트웨이는 기동)
+    try:
+        _run_async(ensure_history_index)
+    except Exception as e:
+        logger.warning("⚠ 히스토리 인덱스 확인 실패: %s", e)
+
+    # 운영 WSGI 서버: waitress 단일 프로세스 + 스레드 MCP_THREADS 개
+    #  - 백그라운드 이벤트 루프 / asyncpg 풀이 프로세스 로컬 싱글톤이므로 프로세스(워커)는 1개만
+    #  - (동일: gunicorn -k gthread -w 1 --threads 16 mcp_http_gateway:app)
+    try:
+        from waitress import serve
+    except ImportError:
+        # waitress 미설치 시 werkzeug 서버 — reloader(프로세스 2개) 없이 멀티스레드로
+        app.run(host="0.0.0.0", port=5400, debug=MCP_DEBUG, use_reloader=False, threaded=True)
+    else:
+        serve(app, host="0.0.0.0", port=5400, threads=MCP_THREADS)
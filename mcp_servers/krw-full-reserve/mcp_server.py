@@ -9,13 +9,11 @@ web_chat_app.py 에서 KRW_RESERVE_MCP = "http://localhost:5400/mcp"
 
 from __future__ import annotations
 
-import asyncio
-import json
-import traceback
-from typing import Dict, Any
-from dateutil.parser import isoparse
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
 
-import threading
 from flask import Flask, request, jsonify
 
 # ─────────────────────────────────────────────
@@ -27,43 +25,73 @@ from app_mcp.tools.offchain import get_offchain_reserves
 from app_mcp.tools.coverage import check_coverage
 from app_mcp.tools.report import get_risk_report
 from app_mcp.tools.history import get_full_reserve_history  # 히스토리 툴
+from core.json_provider import PydanticJSONProvider, dumps_text, json_response
+
+logger = logging.getLogger(__name__)
+
+# MCP_DEBUG=1 이면 요청/응답 디버그 로그 출력 (기본은 INFO — 요청마다 포맷팅하지 않음)
+MCP_DEBUG = os.getenv("MCP_DEBUG", "").lower() in ("1", "true", "yes")
+# waitress 요청 처리 스레드 수 (asyncpg 풀 크기 PG_POOL_MAX 이하로 유지)
+MCP_THREADS = int(os.getenv("MCP_THREADS", "16"))
 
 # ─────────────────────────────────────────────
 # Flask 앱 생성
 # ─────────────────────────────────────────────
 app = Flask(__name__)
+app.json = PydanticJSONProvider(app)
+
+# ─────────────────────────────────────────────
+# 툴별 인자 전처리 (arguments dict → 툴 함수 kwargs)
+# ─────────────────────────────────────────────
+def _parse_ts(value):
+    """
+    ISO8601 문자열 → datetime (문자열이 아니면 그대로).
+    C 구현인 datetime.fromisoformat 사용 — 3.10 은 'Z' 접미사를 못 읽으므로 +00:00 으로 정규화.
+    """
+    if not isinstance(value, str):
+        return value
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _parse_history_args(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """히스토리 툴: 날짜 문자열 → datetime 으로 변환 (실패 시 None)."""
+    for key in ("from_ts", "to_ts"):
+        if key in arguments:
+            try:
+                arguments[key] = _parse_ts(arguments[key])
+            except ValueError:
+                logger.warning("⚠ %s 파싱 실패, None 으로 처리", key)
+                arguments[key] = None
+    return arguments
+
+
+def _drop_format(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """🩹 get_risk_report는 format 인자를 정의하지 않았으므로 방어적으로 제거."""
+    if arguments.pop("format", None) is not None:
+        logger.debug("🩹 get_risk_report arguments에서 format 제거")
+    return arguments
+
 
 # ─────────────────────────────────────────────
-# 사용할 툴 매핑 (MCP tool name → Python 함수)
+# 사용할 툴 매핑 (MCP tool name → (Python 함수, 인자 전처리 or None))
+#  - 툴별 인자 보정은 여기서만 등록 → mcp_call 은 툴 이름으로 분기하지 않는다
 # ─────────────────────────────────────────────
-TOOLS: Dict[str, Any] = {
-    "get_onchain_state": get_onchain_state,
-    "get_offchain_reserves": get_offchain_reserves,
-    "check_coverage": check_coverage,
-    "get_risk_report": get_risk_report,
-    "get_full_reserve_history": get_full_reserve_history,
+TOOLS: Dict[str, Tuple[Callable[..., Any], Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]]] = {
+    "get_onchain_state": (get_onchain_state, None),
+    "get_offchain_reserves": (get_offchain_reserves, None),
+    "check_coverage": (check_coverage, None),
+    "get_risk_report": (get_risk_report, _drop_format),
+    "get_full_reserve_history": (get_full_reserve_history, _parse_history_args),
 }
 
 # ─────────────────────────────────────────────
 # 전역 asyncio 이벤트 루프
-#  - Flask 요청마다 asyncio.run() 쓰면 loop 충돌/블락 → 전역 loop + lock 사용
+#  - Flask 요청마다 asyncio.run() 쓰면 loop 충돌/블락 → 백그라운드 스레드의 전역 loop 사용
+#  - lock 없이 run_coroutine_threadsafe 로 넣으므로 여러 요청이 asyncpg 풀을 동시에 사용
 # ─────────────────────────────────────────────
-_global_loop = asyncio.new_event_loop()
-_loop_lock = threading.Lock()
-asyncio.set_event_loop(_global_loop)
-
-
-def _run_async(func, **kwargs):
-    """
-    async 함수면 전역 이벤트 루프에서 실행하고,
-    sync 함수면 바로 실행하는 헬퍼.
-    """
-    if asyncio.iscoroutinefunction(func):
-        # 하나의 loop에서 순차적으로 실행되도록 lock
-        with _loop_lock:
-            return _global_loop.run_until_complete(func(**kwargs))
-    else:
-        return func(**kwargs)
+from core.async_runner import run_async as _run_async
 
 
 # ─────────────────────────────────────────────
@@ -89,12 +117,12 @@ def mcp_call():
     """
     try:
         payload = request.get_json(silent=True) or {}
-        print("─────────────────────────────────────────────")
-        print(f"🛰 KRW HTTP MCP 수신 payload: {payload}")
 
         method = payload.get("method")
         rpc_id = payload.get("id")
         params = payload.get("params") or {}
+        # 요청 본문 전체 repr 대신 method / tool 이름만 기록
+        logger.debug("🛰 KRW HTTP MCP 수신: method=%s tool=%s", method, params.get("name"))
 
         # JSON-RPC method 검증
         if method != "tools/call":
@@ -102,7 +130,7 @@ def mcp_call():
                 "code": -32601,
                 "message": f"Unsupported method: {method}"
             }
-            print("❌ 잘못된 method:", err)
+            logger.warning("❌ 잘못된 method: %s", err)
             return jsonify({
                 "jsonrpc": "2.0",
                 "id": rpc_id,
@@ -117,51 +145,32 @@ def mcp_call():
                 "code": -32602,
                 "message": "Missing tool name"
             }
-            print("❌ tool_name 누락:", err)
+            logger.warning("❌ tool_name 누락: %s", err)
             return jsonify({
                 "jsonrpc": "2.0",
                 "id": rpc_id,
                 "error": err,
             }), 400
 
-        func = TOOLS.get(tool_name)
-        if not func:
+        entry = TOOLS.get(tool_name)
+        if entry is None:
             err = {
                 "code": -32601,
                 "message": f"Unknown tool: {tool_name}"
             }
-            print("❌ 알 수 없는 MCP 툴:", err)
+            logger.warning("❌ 알 수 없는 MCP 툴: %s", err)
             return jsonify({
                 "jsonrpc": "2.0",
                 "id": rpc_id,
                 "error": err,
             }), 400
 
-        # ─────────────────────────────────────
-        # 히스토리 툴: 날짜 문자열 → datetime 으로 변환
-        # ─────────────────────────────────────
-        if tool_name == "get_full_reserve_history":
-            if "from_ts" in arguments and isinstance(arguments["from_ts"], str):
-                try:
-                    arguments["from_ts"] = isoparse(arguments["from_ts"])
-                except Exception:
-                    print("⚠ from_ts 파싱 실패, None 으로 처리")
-                    arguments["from_ts"] = None
-
-            if "to_ts" in arguments and isinstance(arguments["to_ts"], str):
-                try:
-                    arguments["to_ts"] = isoparse(arguments["to_ts"])
-                except Exception:
-                    print("⚠ to_ts 파싱 실패, None 으로 처리")
-                    arguments["to_ts"] = None
-
-        # 🩹 get_risk_report는 format 인자를 정의하지 않았으므로 방어적으로 제거
-        if tool_name == "get_risk_report" and "format" in arguments:
-            print("🩹 get_risk_report arguments에서 format 제거")
-            arguments.pop("format", None)
+        func, prepare = entry
+        if prepare is not None:
+            arguments = prepare(arguments)
 
         # 🔧 실제 호출 내용 로그
-        print(f"🔧 KRW MCP 호출: {tool_name}({arguments})")
+        logger.debug("🔧 KRW MCP 호출: %s(%s)", tool_name, arguments)
 
         # ─────────────────────────────────────
         # 실제 툴 실행
@@ -170,8 +179,7 @@ def mcp_call():
             result = _run_async(func, **arguments)
         except Exception as tool_err:
             # MCP 툴 내부에서 예외가 나면 JSON-RPC error 로 보내줌
-            print("❌ MCP 툴 실행 중 예외 발생:")
-            traceback.print_exc()
+            logger.exception("❌ MCP 툴 실행 중 예외 발생: %s", tool_name)
 
             return jsonify({
                 "jsonrpc": "2.0",
@@ -184,12 +192,13 @@ def mcp_call():
 
         # web_chat_app.call_krw_reserve_mcp 에서 기대하는 MCP 응답 형식:
         # data["result"]["content"][0]["text"] 에 JSON 문자열이 들어가 있음
+        # datetime / Decimal / pydantic 모델은 pydantic-core 가 직접 직렬화
         try:
-            json_text = json.dumps(result, ensure_ascii=False)
-        except TypeError:
-            # result 안에 datetime 같은 직렬화 불가능한 타입이 있을 수 있으므로 방어
-            print("⚠ result JSON 직렬화 실패, str(result)로 대체")
-            json_text = json.dumps(str(result), ensure_ascii=False)
+            json_text = dumps_text(result)
+        except ValueError:
+            # 그 외 직렬화 불가능한 타입이 섞여 있을 수 있으므로 방어
+            logger.warning("⚠ result JSON 직렬화 실패, str(result)로 대체")
+            json_text = dumps_text(str(result))
 
         response_body = {
             "jsonrpc": "2.0",
@@ -204,13 +213,13 @@ def mcp_call():
             }
         }
 
-        print("✅ MCP 응답 전송:", response_body)
-        return jsonify(response_body)
+        # 응답 본문 전체(str(response_body))는 찍지 않고 크기만 기록
+        logger.debug("✅ MCP 응답 전송: %s (%d bytes)", tool_name, len(json_text))
+        return json_response(response_body)
 
     except Exception as e:
         # Gateway 레벨 예외 처리
-        print("❌ KRW MCP HTTP Gateway 에러:", e)
-        traceback.print_exc()
+        logger.exception("❌ KRW MCP HTTP Gateway 에러: %s", e)
         return jsonify({
             "jsonrpc": "2.0",
             "id": None,
@@ -236,11 +245,20 @@ def health():
 # 메인 실행
 # ─────────────────────────────────────────────
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if MCP_DEBUG else logging.INFO)
+
     print("=" * 60)
     print("🚀 KRW Full Reserve MCP HTTP Gateway 시작")
     print("   - URL: http://0.0.0.0:5400/mcp")
     print("   - Tools:", ", ".join(TOOLS.keys()))
     print("=" * 60)
-    # debug=True 는 코드 핫리로드 때문에 프로세스 2개 뜨는 구조라
-    # 이벤트 루프가 꼬일 수 있음 → 실제 운영에서는 debug=False 권장
-    app.run(host="0.0.0.0", port=5400, debug=True)
+    # 운영 WSGI 서버: waitress 단일 프로세스 + 스레드 MCP_THREADS 개
+    #  - 백그라운드 이벤트 루프 / asyncpg 풀이 프로세스 로컬 싱글톤이므로 프로세스(워커)는 1개만
+    #  - (동일: gunicorn -k gthread -w 1 --threads 16 mcp_server:app)
+    try:
+        from waitress import serve
+    except ImportError:
+        # waitress 미설치 시 werkzeug 서버 — reloader(프로세스 2개) 없이 멀티스레드로
+        app.run(host="0.0.0.0", port=5400, debug=MCP_DEBUG, use_reloader=False, threaded=True)
+    else:
+        serve(app, host="0.0.0.0", port=5400, threads=MCP_THREADS)
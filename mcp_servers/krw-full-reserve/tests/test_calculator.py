@@ -0,0 +1,101 @@
+"""
+담보율 계산 / 리스크 레벨 분류 테스트
+"""
+
+import pytest
+
+from core.calculator import analyze_risk_level_batch, calculate_coverage
+from core.constants import RISK_BANDS
+from core.types import OffChainReserves, OnChainState, Supply
+
+
+def _coverage(reserves, circulation):
+    # calculate_coverage 는 net_circulation / total_reserves 만 사용
+    on_chain = OnChainState.model_construct(
+        supply=Supply.model_construct(net_circulation=circulation)
+    )
+    off_chain = OffChainReserves.model_construct(total_reserves=reserves)
+    return calculate_coverage(on_chain, off_chain)
+
+
+class TestCoverageThresholds:
+    """임계값(103 / 110 / 115%) 경계 판정 — 정수 스케일 비교"""
+
+    @pytest.mark.parametrize(
+        "reserves, circulation",
+        [
+            (1_150, 1_000),             # float 로는 114.99999999999999%
+            (1_110_187, 965_380),       # float 로는 114.99999999999999%
+        ],
+    )
+    def test_exact_optimal_is_ok(self, reserves, circulation):
+        """정확히 115% 는 OK (float 오차로 WARNING 이 되지 않음)"""
+        result = _coverage(reserves, circulation)
+
+        assert result.coverage_ratio == 115.0
+        assert result.verdict.status == "OK"
+        assert result.verdict.message == "담보율 115.00% - 정상 운영 중"
+
+    def test_just_below_optimal_is_warning(self):
+        result = _coverage(1_149_999, 1_000_000)
+
+        assert result.coverage_ratio == 114.9999
+        assert result.verdict.status == "WARNING"
+
+    def test_rounds_up_to_threshold_but_judged_below(self):
+        """표시값은 115.0 으로 반올림돼도 실제 비율(114.99996%)이 미만이면 WARNING"""
+        result = _coverage(114_999_960, 100_000_000)
+
+        assert result.coverage_ratio == 115.0
+        assert result.verdict.status == "WARNING"
+
+    @pytest.mark.parametrize(
+        "reserves, circulation, status, suffix",
+        [
+            (1_100, 1_000, "WARNING", "주의 필요 (모니터링 강화 권장)"),
+            (1_099_999, 1_000_000, "WARNING", "기준 근접, 추가 담보 확보 검토 필요"),
+            (1_030, 1_000, "WARNING", "기준 근접, 추가 담보 확보 검토 필요"),
+            (1_029_999, 1_000_000, "DEFICIT", "긴급 조치 필요 (담보 부족)"),
+        ],
+    )
+    def test_warning_and_critical_boundaries(self, reserves, circulation, status, suffix):
+        result = _coverage(reserves, circulation)
+
+        assert result.verdict.status == status
+        assert result.verdict.message.endswith(suffix)
+
+    def test_ratio_rounds_half_up(self):
+        """coverage_ratio 는 소수 4자리 half-up (100.00005% → 100.0001)"""
+        result = _coverage(2_000_001, 2_000_000)
+
+        assert result.coverage_ratio == 100.0001
+
+    def test_zero_circulation(self):
+        result = _coverage(1_000, 0)
+
+        assert result.coverage_ratio == 0.0
+        assert result.excess_collateral == 1_000
+        assert result.verdict.status == "DEFICIT"
+
+
+class TestRiskLevelBatch:
+    """analyze_risk_level_batch — analyze_risk 와 같은 RISK_BANDS 기준"""
+
+    def test_band_boundaries(self):
+        ratios = [105.0, 104.9999, 100.0, 99.9999, 98.0, 97.9999, 0.0, 150.0]
+
+        assert analyze_risk_level_batch(ratios) == [
+            "LOW", "MEDIUM", "MEDIUM", "HIGH", "HIGH", "CRITICAL", "CRITICAL", "LOW",
+        ]
+
+    def test_matches_risk_bands_scan(self):
+        ratios = [x / 4 for x in range(380, 440)]
+        expected = [
+            next(level for threshold, level in RISK_BANDS if cr >= threshold)
+            for cr in ratios
+        ]
+
+        assert analyze_risk_level_batch(iter(ratios)) == expected
+
+    def test_empty(self):
+        assert analyze_risk_level_batch([]) == []
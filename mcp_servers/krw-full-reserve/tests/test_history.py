@@ -0,0 +1,54 @@
+"""
+히스토리 툴 행 변환 테스트
+"""
+
+from datetime import datetime, timezone
+
+from app_mcp.tools.history import _history_query, _row_builder
+
+
+class TestRowBuilder:
+    """MV 행 → point dict 변환"""
+
+    def test_timestamp_matches_isoformat(self):
+        """timestamp 는 datetime.isoformat() 과 동일 (마이크로초 0 이면 소수부 없음)"""
+        ts = datetime(2025, 11, 26, 9, 30, tzinfo=timezone.utc)
+        point = _row_builder("all")((ts, 105.0, 1.0, 2.0, 3.0, 4.0))
+
+        assert point["timestamp"] == "2025-11-26T09:30:00+00:00"
+        assert point["timestamp"] == ts.isoformat()
+
+    def test_timestamp_keeps_microseconds(self):
+        """마이크로초가 있으면 그대로 출력"""
+        ts = datetime(2025, 11, 26, 9, 30, 0, 123456, tzinfo=timezone.utc)
+        point = _row_builder("onchain")((ts, 1.0, 1.01))
+
+        assert point == {
+            "timestamp": "2025-11-26T09:30:00.123456+00:00",
+            "onchain_price": 1.0,
+            "theoretical_price": 1.01,
+        }
+
+    def test_unknown_metric_timestamp_only(self):
+        """알 수 없는 metric 은 timestamp 만"""
+        point = _row_builder("unknown")((datetime(2025, 1, 1),))
+
+        assert point == {"timestamp": "2025-01-01T00:00:00"}
+
+
+class TestHistoryQuery:
+    """metric / 기간 조건별 SQL 선택"""
+
+    def test_select_only_metric_columns(self):
+        sql, args = _history_query("onchain", None, None, 10)
+
+        assert "onchain_price" in sql
+        assert "coverage_ratio" not in sql
+        assert args == [10]
+
+    def test_range_args_order(self):
+        sql, args = _history_query("all", "2025-01-01", "2025-02-01", 5)
+
+        assert "timestamp >= $1::timestamptz" in sql
+        assert "timestamp <= $2::timestamptz" in sql
+        assert args == ["2025-01-01", "2025-02-01", 5]
@@ -0,0 +1,165 @@
+"""
+MCP HTTP Gateway 응답 형식 테스트
+(툴 함수는 가짜 async 함수로 교체 — DB / 백엔드 API 없이 실행)
+"""
+
+import json
+
+import ormsgpack
+import pytest
+
+import mcp_http_gateway as gateway
+
+
+async def _fake_history(metric="all", from_ts=None, to_ts=None, limit=1000):
+    return {
+        "metric": metric,
+        "from": from_ts,
+        "to": to_ts,
+        "count": 1,
+        "points": [{"timestamp": "2025-01-01T00:00:00+00:00", "coverage_ratio": 105.25}],
+    }
+
+
+async def _fake_echo(**kwargs):
+    return {"echo": kwargs}
+
+
+# 스트리밍 경로용 가짜 iter_full_reserve_history: 호출 인자 기록 + 지정한 chunk 들을 순서대로 yield
+_STREAM_CHUNKS = [
+    [
+        {"timestamp": "2025-01-01T00:00:00+00:00", "coverage_ratio": 105.25},
+        {"timestamp": "2025-01-01T01:00:00+00:00", "coverage_ratio": 104.5},
+    ],
+    [],
+    [{"timestamp": "2025-01-01T02:00:00+00:00", "note": 'say "hi" \\ 담보율'}],
+]
+
+
+@pytest.fixture
+def stream_calls(monkeypatch):
+    calls = []
+    chunks = list(_STREAM_CHUNKS)
+
+    async def _fake_iter(metric="all", from_ts=None, to_ts=None, limit=1000):
+        calls.append((metric, from_ts, to_ts, limit))
+        for points in chunks:
+            yield points
+
+    monkeypatch.setattr(gateway, "iter_full_reserve_history", _fake_iter)
+    monkeypatch.setattr(gateway, "_HISTORY_TEXT_CACHE", {})
+    return calls, chunks
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setitem(gateway.TOOLS, "get_full_reserve_history", (_fake_history, None))
+    monkeypatch.setitem(gateway.TOOLS, "fake_echo", (_fake_echo, None))
+    return gateway.app.test_client()
+
+
+def _call(client, name, arguments=None, rpc_id=1, headers=None):
+    return client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": rpc_id,
+            "params": {"name": name, "arguments": arguments or {}},
+        },
+        headers=headers or {},
+    )
+
+
+class TestMsgpackResponse:
+    """Accept: application/msgpack 협상 테스트"""
+
+    def test_msgpack_body_decodes(self, client):
+        """msgpack 요청 시 결과 객체가 content[0].data 에 그대로 담긴다"""
+        resp = _call(
+            client,
+            "get_full_reserve_history",
+            {"metric": "coverage"},
+            rpc_id=7,
+            headers={"Accept": "application/msgpack"},
+        )
+
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/msgpack"
+
+        body = ormsgpack.unpackb(resp.data)
+        assert body["jsonrpc"] == "2.0"
+        assert body["id"] == 7
+
+        content = body["result"]["content"][0]
+        assert content["type"] == "msgpack"
+        assert content["data"]["metric"] == "coverage"
+        assert content["data"]["points"][0]["coverage_ratio"] == 105.25
+
+    def test_default_accept_stays_json(self, client):
+        """Accept 미지정 / */* 는 기존 JSON 응답 유지"""
+        resp = _call(client, "fake_echo", {"x": 1}, headers={"Accept": "*/*"})
+
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/json"
+        assert resp.get_json()["result"]["content"][0]["text"] == '{"echo":{"x":1}}'
+
+
+class TestStreamHistory:
+    """get_full_reserve_history 스트리밍 JSON 응답 — 조립된 본문이 json.loads 로 복원되는지"""
+
+    def _text(self, resp):
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/json"
+        body = json.loads(resp.get_data(as_text=True))
+        content = body["result"]["content"][0]
+        assert content["type"] == "json"
+        return body, json.loads(content["text"])
+
+    def test_multiple_chunks(self, client, stream_calls):
+        """여러 chunk(빈 chunk 포함)의 points 가 순서대로 합쳐지고 count 가 맞다"""
+        resp = _call(client, "get_full_reserve_history", {"metric": "coverage", "limit": 3}, rpc_id=11)
+        body, result = self._text(resp)
+
+        assert body["jsonrpc"] == "2.0"
+        assert body["id"] == 11
+        assert result == {
+            "metric": "coverage",
+            "from": None,
+            "to": None,
+            "points": [p for chunk in _STREAM_CHUNKS for p in chunk],
+            "count": 3,
+        }
+        assert result["points"][-1]["note"] == 'say "hi" \\ 담보율'
+
+    def test_escaped_rpc_id_and_args(self, client, stream_calls):
+        """문자열 id / 인자에 따옴표·백슬래시·한글이 있어도 JSON 이 깨지지 않는다"""
+        rpc_id = 'req-"1"\\한글'
+        from_ts = '2025-01-01"\\'
+        resp = _call(client, "get_full_reserve_history", {"from_ts": from_ts}, rpc_id=rpc_id)
+        body, result = self._text(resp)
+
+        assert body["id"] == rpc_id
+        assert result["from"] == from_ts
+
+    def test_empty_result(self, client, stream_calls):
+        _, chunks = stream_calls
+        chunks.clear()
+
+        resp = _call(client, "get_full_reserve_history", {"metric": "onchain"})
+        _, result = self._text(resp)
+
+        assert result["points"] == []
+        assert result["count"] == 0
+
+    def test_cache_hit_skips_query(self, client, stream_calls):
+        """같은 인자 재요청은 캐시된 text 재사용 (DB 조회 1회), id 는 요청마다 반영"""
+        calls, _ = stream_calls
+        args = {"metric": "all", "limit": 50}
+
+        _, first = self._text(_call(client, "get_full_reserve_history", args, rpc_id=1))
+        body, second = self._text(_call(client, "get_full_reserve_history", args, rpc_id=2))
+
+        assert calls == [("all", None, None, 50)]
+        assert body["id"] == 2
+        assert second == first